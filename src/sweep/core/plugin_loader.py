@@ -7,6 +7,7 @@ import inspect
 import json
 import logging
 import pkgutil
+from functools import cache
 from pathlib import Path
 from types import ModuleType
 
@@ -34,8 +35,13 @@ def _find_plugins_in_module(module: ModuleType) -> list[type[CleanPlugin]]:
     return plugins
 
 
-def _load_builtin_plugins() -> list[type[CleanPlugin]]:
-    """Load plugins from the sweep.plugins package."""
+@cache
+def _load_builtin_plugins() -> tuple[type[CleanPlugin], ...]:
+    """Load plugins from the sweep.plugins package.
+
+    The built-in package cannot change while the process runs, so the
+    discovered classes are cached and later registries reuse them.
+    """
     import sweep.plugins as plugins_pkg
 
     found: list[type[CleanPlugin]] = []
@@ -45,7 +51,7 @@ def _load_builtin_plugins() -> list[type[CleanPlugin]]:
             found.extend(_find_plugins_in_module(module))
         except Exception:
             log.exception("Failed to load built-in plugin module: %s", modname)
-    return found
+    return tuple(found)
 
 
 def _load_plugins_from_directory(directory: Path) -> list[type[CleanPlugin]]:
@@ -89,11 +95,17 @@ def _get_config_plugin_paths() -> list[Path]:
         return []
 
 
-def load_plugins(registry: PluginRegistry) -> None:
+def load_plugins(registry: PluginRegistry, force: bool = False) -> None:
     """Discover and register all available plugins.
 
     Searches in order: built-in, system-wide, user-local, config-specified.
+    A registry that already holds plugins is left as is unless *force*
+    is set, in which case newly found plugins are added to it.
     """
+    if len(registry) and not force:
+        log.debug("Registry already populated, skipping plugin discovery")
+        return
+
     ensure_system_python_paths()
 
     plugin_classes: list[type[CleanPlugin]] = []
@@ -111,10 +123,13 @@ def load_plugins(registry: PluginRegistry) -> None:
     for path in _get_config_plugin_paths():
         plugin_classes.extend(_load_plugins_from_directory(path))
 
-    # Instantiate and register
+    # Instantiate and register; a forced reload only adds plugins not registered yet
+    registered = {plugin.id for plugin in registry}
     for cls in plugin_classes:
         try:
             instance = cls()
+            if instance.id in registered:
+                continue
             registry.register(instance)
         except Exception:
             log.exception("Failed to instantiate plugin: %s", cls.__name__)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import Iterator
 
 from sweep.models.plugin import CleanPlugin, PluginGroup
@@ -15,6 +16,9 @@ class PluginRegistry:
 
     def __init__(self) -> None:
         self._plugins: dict[str, CleanPlugin] = {}
+        # Indexes by category and group id, in registration order
+        self._by_category: defaultdict[str, list[CleanPlugin]] = defaultdict(list)
+        self._by_group: defaultdict[str, list[CleanPlugin]] = defaultdict(list)
 
     def register(self, plugin: CleanPlugin) -> None:
         """Register a plugin instance."""
@@ -22,6 +26,9 @@ class PluginRegistry:
             log.warning("Plugin '%s' already registered, skipping duplicate", plugin.id)
             return
         self._plugins[plugin.id] = plugin
+        self._by_category[plugin.category].append(plugin)
+        if plugin.group is not None:
+            self._by_group[plugin.group.id].append(plugin)
         log.debug("Registered plugin: %s (%s)", plugin.id, plugin.name)
 
     def get(self, plugin_id: str) -> CleanPlugin | None:
@@ -34,10 +41,13 @@ class PluginRegistry:
 
     def get_by_category(self, category: str) -> list[CleanPlugin]:
         """Get all plugins in a given category."""
-        return [p for p in self._plugins.values() if p.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_available(self) -> list[CleanPlugin]:
-        """Get all plugins that are available on this system."""
+        """Get all plugins that are available on this system.
+
+        Availability is checked on every call, as it can change at runtime.
+        """
         available = []
         for plugin in self._plugins.values():
             try:
@@ -62,15 +72,11 @@ class PluginRegistry:
         Returns a dict mapping group_id -> list of plugins in that group.
         Only includes plugins that have a group set.
         """
-        groups: dict[str, list[CleanPlugin]] = {}
-        for plugin in self._plugins.values():
-            if plugin.group is not None:
-                groups.setdefault(plugin.group.id, []).append(plugin)
-        return groups
+        return {group_id: list(plugins) for group_id, plugins in self._by_group.items()}
 
     def get_group_plugins(self, group_id: str) -> list[CleanPlugin]:
         """Get all plugins belonging to a specific group."""
-        return [p for p in self._plugins.values() if p.group is not None and p.group.id == group_id]
+        return list(self._by_group.get(group_id, ()))
 
     def get_managed_cache_names(self, exclude_id: str | None = None) -> set[str]:
         """Collect all cache directory names managed by registered plugins.
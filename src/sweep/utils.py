@@ -184,6 +184,17 @@ def dir_size(path: Path) -> int:
     return dir_info(path)[0]
 
 
+def common_parent(paths: list[Path]) -> Path:
+    """Find the deepest common parent directory for a list of paths.
+
+    Parents are compared component by component, so ``/home/al`` is not
+    taken as a parent of ``/home/alice``.
+    """
+    if not paths:
+        return Path("/")
+    return Path(os.path.commonpath([p.parent for p in paths]))
+
+
 def bytes_to_human(size_bytes: int) -> str:
     """Convert byte count to a human-readable string."""
     if size_bytes < 0:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable
 
 from sweep.models.scan_result import FileEntry, ScanResult
 from sweep.models.clean_result import CleanResult
+from sweep.utils import common_parent
 
 log = logging.getLogger(__name__)
 
@@ -67,35 +70,48 @@ class SweepClient:
         return result
 
     def _transform_scan_result(self, r: ScanResult) -> dict[str, Any]:
-        """Transform a ScanResult into a serializable dict for the UI."""
+        """Transform a ScanResult into a serializable dict for the UI.
+
+        Runs on the scan worker thread, so path-derived display fields
+        (entry names and URIs, the common parent) and the by-size entry
+        order are computed here rather than on the GTK main loop.  The ids
+        the view keys its lookups by are interned so those compare by identity.
+        """
         plugin = self._engine.registry.get(r.plugin_id)
+        entries = [
+            {
+                "path": str(e.path),
+                "name": e.path.name,
+                "uri": e.path.as_uri() if e.path.is_absolute() else "",
+                "size_bytes": e.size_bytes,
+                "description": e.description,
+                "is_dir": e.path.is_dir(),
+                "is_leaf": e.is_leaf,
+                "child_count": e.file_count or 1,
+            }
+            for e in r.entries
+        ]
         entry: dict[str, Any] = {
-            "plugin_id": r.plugin_id,
+            "plugin_id": sys.intern(r.plugin_id),
             "plugin_name": r.plugin_name,
+            "sort_name": r.plugin_name.lower(),
             "icon": plugin.icon if plugin else "application-x-executable-symbolic",
             "sort_order": plugin.sort_order if plugin else 50,
             "total_bytes": r.total_bytes,
             "file_count": len(r.entries),
+            "total_files": sum(map(itemgetter("child_count"), entries)),
             "summary": r.summary,
-            "category": plugin.category if plugin else "user",
+            "category": sys.intern(plugin.category) if plugin else "user",
             "requires_root": plugin.requires_root if plugin else False,
             "item_noun": plugin.item_noun if plugin else "file",
-            "entries": [
-                {
-                    "path": str(e.path),
-                    "size_bytes": e.size_bytes,
-                    "description": e.description,
-                    "is_dir": e.path.is_dir(),
-                    "is_leaf": e.is_leaf,
-                    "child_count": e.file_count or 1,
-                }
-                for e in r.entries
-            ],
+            "common_parent": str(common_parent([e.path for e in r.entries])),
+            "entries": entries,
+            "entries_by_size": sorted(entries, key=itemgetter("size_bytes"), reverse=True),
         }
         if r.error:
             entry["error"] = r.error
         if plugin and plugin.group:
-            entry["group"] = {"id": plugin.group.id, "name": plugin.group.name}
+            entry["group"] = {"id": sys.intern(plugin.group.id), "name": plugin.group.name}
         return entry
 
     @staticmethod
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import gi
@@ -271,9 +272,9 @@ class DashboardView(Gtk.Box):
         self._breakdown_group.set_visible(True)
 
         # Group by category, then aggregate plugin groups within each
-        by_category: dict[str, list[dict]] = {}
+        by_category: dict[str, list[dict]] = defaultdict(list)
         for r in actionable:
-            by_category.setdefault(r.get("category", "user"), []).append(r)
+            by_category[r.get("category", "user")].append(r)
 
         cat_display: dict[str, list[dict]] = {}
         for cat, cat_results in by_category.items():
@@ -441,9 +442,9 @@ class DashboardView(Gtk.Box):
             )
 
         # Group display items by category
-        cat_data: dict[str, list[dict]] = {}
+        cat_data: dict[str, list[dict]] = defaultdict(list)
         for item in display_items:
-            cat_data.setdefault(item["category"], []).append(item)
+            cat_data[item["category"]].append(item)
 
         # Sort categories by total bytes freed (descending)
         cat_totals = {cat: sum(it["bytes_freed"] for it in items) for cat, items in cat_data.items()}
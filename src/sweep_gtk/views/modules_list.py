@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import gi
@@ -91,10 +92,9 @@ class ModulesView(Gtk.Box):
 
         # Build plugin groups by category
         plugins = window.client.list_plugins()
-        categories: dict[str, list[dict]] = {}
+        categories: dict[str, list[dict]] = defaultdict(list)
         for plugin in plugins:
-            cat = plugin["category"]
-            categories.setdefault(cat, []).append(plugin)
+            categories[plugin["category"]].append(plugin)
 
         for cat_id in CATEGORY_LABELS.keys():
             if cat_id not in categories:
@@ -106,12 +106,12 @@ class ModulesView(Gtk.Box):
             cat_plugins = categories[cat_id]
 
             # Partition into grouped and standalone
-            grouped: dict[str, list[dict]] = {}
+            grouped: dict[str, list[dict]] = defaultdict(list)
             standalone: list[dict] = []
             for plugin in cat_plugins:
                 g = plugin.get("group")
                 if g:
-                    grouped.setdefault(g["id"], []).append(plugin)
+                    grouped[g["id"]].append(plugin)
                 else:
                     standalone.append(plugin)
 
@@ -163,7 +163,8 @@ class ModulesView(Gtk.Box):
 
     def refresh(self) -> None:
         """Re-query has_items state for all plugins and update the UI."""
-        fresh = self.window.client.list_plugins()
+        self.window.invalidate_plugin_cache()
+        fresh = self.window.cached_list_plugins()
         for plugin_info in fresh:
             pid = plugin_info["id"]
             row = self._plugin_rows.get(pid)
@@ -391,6 +392,7 @@ class ModulesView(Gtk.Box):
         """Persist current module selection to settings."""
         selected = self.get_selected_plugin_ids()
         Settings.instance().set(_SETTINGS_KEY, selected)
+        self.window.invalidate_plugin_cache()
         self.scan_btn.set_sensitive(bool(selected))
 
     def _set_all(self, enabled: bool) -> None:
@@ -420,7 +422,7 @@ class ModulesView(Gtk.Box):
         self.scan_btn.set_label("Scanning...")
 
         # Compute group info: group_id -> count of selected members in that group
-        plugins = self.window.client.list_plugins()
+        plugins = self.window.cached_list_plugins()
         plugin_map = {p["id"]: p for p in plugins}
         group_info: dict[str, int] = {}
         for pid in selected:
@@ -438,7 +440,7 @@ class ModulesView(Gtk.Box):
 
         def do_scan():
             def on_result(result: dict):
-                GLib.idle_add(results_view.add_streaming_result, result, generation)
+                results_view.post_streaming_result(result, generation)
 
             self.window.client.scan_streaming(
                 plugin_ids=selected,
@@ -458,7 +460,7 @@ class ModulesView(Gtk.Box):
         results_view = self.window.scan_results_view
         elapsed = results_view.finish_streaming_scan()
 
-        total = sum(r["total_bytes"] for r in results_view._scan_results)
+        total = results_view.total_bytes
         time_str = _format_elapsed(elapsed)
         if total > 0:
             self.window.show_toast(
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import threading
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import gi
@@ -14,12 +16,34 @@ from gi.repository import Adw, Gtk, GLib
 
 from sweep.utils import bytes_to_human
 from sweep_gtk.dialogs import show_confirm_dialog
+from sweep_gtk.views.scan_results.helpers import _IdleQueue
 from sweep_gtk.views.settings import SettingsView
 
 if TYPE_CHECKING:
     from sweep_gtk.views.scan_results.view import ScanResultsView
 
 
+@dataclass(slots=True)
+class _GroupTrack:
+    """Aggregated clean progress for one plugin group."""
+
+    expected: int
+    completed: int = 0
+    freed_bytes: int = 0
+    errors: int = 0
+    members: list[tuple[str, int]] = field(default_factory=list)
+
+
+def _apply_status(check_img: Gtk.Image, success: bool) -> None:
+    """Show the success/warning icon, replacing the style class in one update."""
+    if success:
+        check_img.set_from_icon_name("emblem-ok-symbolic")
+        check_img.set_css_classes(["success"])
+    else:
+        check_img.set_from_icon_name("dialog-warning-symbolic")
+        check_img.set_css_classes(["warning"])
+
+
 class _CleanController:
     """Manages the clean workflow: confirmation dialog, progress, and completion.
 
@@ -33,11 +57,14 @@ class _CleanController:
         self._clean_status: dict[str, tuple[Gtk.Spinner, Gtk.Image, Gtk.Label]] = {}
         self._clean_total: int = 0
         self._clean_completed: int = 0
+        self._banner_tail: str = ""
         self._clean_done: bool = False
         self._group_clean_status: dict[str, tuple[Gtk.Spinner, Gtk.Image, Gtk.Label]] = {}
         self._plugin_to_group: dict[str, str] = {}
-        self._group_clean_tracking: dict[str, dict] = {}
+        self._group_clean_tracking: dict[str, _GroupTrack] = {}
         self._plugin_names: dict[str, str] = {}
+        # Results posted by the clean thread, applied by one idle callback per burst
+        self._results = _IdleQueue(self._on_clean_results)
 
     @property
     def is_done(self) -> bool:
@@ -46,6 +73,8 @@ class _CleanController:
     def clear(self) -> None:
         self._clean_status.clear()
         self._group_clean_status.clear()
+        self._plugin_to_group.clear()
+        self._plugin_names.clear()
 
     def register_plugin(self, plugin_id: str, spinner: Gtk.Spinner, check_img: Gtk.Image, label: Gtk.Label) -> None:
         self._clean_status[plugin_id] = (spinner, check_img, label)
@@ -53,6 +82,12 @@ class _CleanController:
     def register_group(self, group_id: str, spinner: Gtk.Spinner, check_img: Gtk.Image, label: Gtk.Label) -> None:
         self._group_clean_status[group_id] = (spinner, check_img, label)
 
+    def register_group_members(self, group_id: str, member_results: list[dict]) -> None:
+        """Map group members to their group and remember their display names."""
+        for r in member_results:
+            self._plugin_to_group[r["plugin_id"]] = group_id
+            self._plugin_names[r["plugin_id"]] = r["plugin_name"]
+
     def remove_plugin_ids(self, plugin_ids: set[str]) -> None:
         for pid in plugin_ids:
             self._clean_status.pop(pid, None)
@@ -73,7 +108,7 @@ class _CleanController:
             view.window.switch_to_dashboard()
             return
 
-        entries_by_plugin = view._selection.get_entries_by_plugin()
+        entries_by_plugin, sel = view._selection.get_clean_payload()
 
         if not entries_by_plugin:
             view.window.show_toast("Nothing selected to clean.")
@@ -84,23 +119,24 @@ class _CleanController:
             return
 
         # Build descriptive dialog from selection info
-        sel = view._selection.get_selection_info()
         total_items = sel["total_items"]
 
-        lines = []
-        for m in sorted(sel["modules"], key=lambda m: m["size"], reverse=True):
-            count = m["item_count"]
-            lines.append(
-                f"  {m['name']} \u2014 {bytes_to_human(m['size'])} " f"({count} item{'s' if count != 1 else ''})"
-            )
+        modules = sorted(sel["modules"], key=itemgetter("size"), reverse=True)
+        lines = [
+            f"  {name} \u2014 {bytes_to_human(size)} ({count} item{'s' if count != 1 else ''})"
+            for name, size, count in ((m["name"], m["size"], m["item_count"]) for m in modules)
+        ]
 
-        body = "The following will be permanently deleted:\n\n"
-        body += "\n".join(lines)
-        body += f"\n\nTotal: {bytes_to_human(sel['total_size'])}. This cannot be undone."
+        parts = [
+            "The following will be permanently deleted:\n\n",
+            "\n".join(lines),
+            f"\n\nTotal: {bytes_to_human(sel['total_size'])}. This cannot be undone.",
+        ]
 
-        root_names = sorted(m["name"] for m in sel["modules"] if m["requires_root"])
+        root_names = sorted(m["name"] for m in modules if m["requires_root"])
         if root_names:
-            body += f"\n\nAdministrator authentication is required for: " f"{', '.join(root_names)}."
+            parts.append(f"\n\nAdministrator authentication is required for: {', '.join(root_names)}.")
+        body = "".join(parts)
 
         show_confirm_dialog(
             view.window,
@@ -125,32 +161,38 @@ class _CleanController:
         view.clean_btn.set_label("Cleaning\u2026")
         view._toolbar_revealer.set_reveal_child(False)
 
-        # Hide rows not being cleaned
-        for plugin_id, row in view._plugin_rows.items():
-            if plugin_id not in entries_by_plugin:
-                row.set_visible(False)
-
-        # Hide group expanders where no members are being cleaned
-        for group_id, member_ids in view._group_plugin_ids.items():
-            if not any(pid in entries_by_plugin for pid in member_ids):
-                expander = view._expander_rows.get(group_id)
-                if expander:
-                    expander.set_visible(False)
-
-        # Hide category groups with nothing being cleaned
-        cleaned_cats = {view._plugin_to_cat[pid] for pid in entries_by_plugin if pid in view._plugin_to_cat}
-        for cat_id, cat_group in view._category_groups.items():
-            if cat_id not in cleaned_cats:
-                cat_group.set_visible(False)
-
-        # Hide the "Nothing Found" group
-        if view._nothing_found_group:
-            view._nothing_found_group.set_visible(False)
+        # Hide the page while toggling rows so GTK lays it out once, not per row
+        view.prefs_page.set_visible(False)
+        try:
+            # Hide rows not being cleaned
+            for plugin_id, row in view._plugin_rows.items():
+                if plugin_id not in entries_by_plugin:
+                    row.set_visible(False)
+
+            # Hide group expanders where no members are being cleaned
+            for group_id, member_ids in view._group_plugin_ids.items():
+                if not any(pid in entries_by_plugin for pid in member_ids):
+                    expander = view._expander_rows.get(group_id)
+                    if expander:
+                        expander.set_visible(False)
+
+            # Hide category groups with nothing being cleaned
+            cleaned_cats = {view._plugin_to_cat[pid] for pid in entries_by_plugin if pid in view._plugin_to_cat}
+            for cat_id, cat_group in view._category_groups.items():
+                if cat_id not in cleaned_cats:
+                    cat_group.set_visible(False)
+
+            # Hide the "Nothing Found" group
+            if view._nothing_found_group:
+                view._nothing_found_group.set_visible(False)
+        finally:
+            view.prefs_page.set_visible(True)
 
         # Overall clean progress
         self._clean_total = len(entries_by_plugin)
         self._clean_completed = 0
-        view._progress_banner.set_title(f"Cleaning 0/{self._clean_total} modules\u2026")
+        self._banner_tail = f"/{self._clean_total} modules\u2026"
+        view._progress_banner.set_title("Cleaning 0" + self._banner_tail)
         view._progress_bar.set_fraction(0.0)
         view._progress_bar_row.set_visible(True)
         view._progress_spinner.set_spinning(True)
@@ -165,44 +207,42 @@ class _CleanController:
                 spinner.set_spinning(True)
 
         # Initialize group-level tracking
-        self._plugin_names = {r["plugin_id"]: r["plugin_name"] for r in view._scan_results}
-        self._plugin_to_group.clear()
         self._group_clean_tracking.clear()
         for group_id, member_ids in view._group_plugin_ids.items():
             members_cleaning = [pid for pid in member_ids if pid in entries_by_plugin]
             if not members_cleaning:
                 continue
-            for pid in member_ids:
-                self._plugin_to_group[pid] = group_id
-            self._group_clean_tracking[group_id] = {
-                "expected": len(members_cleaning),
-                "completed": 0,
-                "freed_bytes": 0,
-                "errors": 0,
-                "members": [],
-            }
+            self._group_clean_tracking[group_id] = _GroupTrack(expected=len(members_cleaning))
             status = self._group_clean_status.get(group_id)
             if status:
                 spinner, _, _ = status
                 spinner.set_visible(True)
                 spinner.set_spinning(True)
 
+        self._results.clear()
+        post_result = self._results.put
+
         def do_clean():
             results = view.window.client.clean_streaming(
                 entries_by_plugin=entries_by_plugin,
-                on_result=lambda r: GLib.idle_add(self._on_single_clean_result, r),
+                on_result=post_result,
             )
             GLib.idle_add(self._on_all_clean_complete, results)
 
         threading.Thread(target=do_clean, daemon=True).start()
 
+    def _on_clean_results(self, results: list[dict]) -> None:
+        """Apply a batch of clean results posted by the worker thread."""
+        for result in results:
+            self._on_single_clean_result(result)
+
     def _on_single_clean_result(self, result: dict) -> None:
         """Handle a single clean result during progressive cleaning."""
         view = self._view
         self._clean_completed += 1
         if self._clean_total > 0:
             view._progress_bar.set_fraction(self._clean_completed / self._clean_total)
-        view._progress_banner.set_title(f"Cleaning {self._clean_completed}/{self._clean_total} modules\u2026")
+        view._progress_banner.set_title("Cleaning " + str(self._clean_completed) + self._banner_tail)
 
         plugin_id = result["plugin_id"]
         status = self._clean_status.get(plugin_id)
@@ -214,14 +254,9 @@ class _CleanController:
             spinner.set_visible(False)
 
             # Show status
-            if result["errors"]:
-                check_img.set_from_icon_name("dialog-warning-symbolic")
-                check_img.add_css_class("warning")
-                label.set_label("Error")
-            else:
-                check_img.set_from_icon_name("emblem-ok-symbolic")
-                check_img.add_css_class("success")
-                label.set_label(f"Freed {bytes_to_human(result['freed_bytes'])}")
+            success = not result["errors"]
+            _apply_status(check_img, success)
+            label.set_label(f"Freed {bytes_to_human(result['freed_bytes'])}" if success else "Error")
 
             check_img.set_visible(True)
             label.set_visible(True)
@@ -231,19 +266,14 @@ class _CleanController:
         if group_id:
             tracking = self._group_clean_tracking.get(group_id)
             if tracking:
-                tracking["completed"] += 1
-                tracking["freed_bytes"] += result["freed_bytes"]
-                tracking["errors"] += len(result["errors"])
-                tracking["members"].append(
-                    {
-                        "name": self._plugin_names.get(plugin_id, plugin_id),
-                        "freed_bytes": result["freed_bytes"],
-                    }
-                )
-                if tracking["completed"] >= tracking["expected"]:
+                tracking.completed += 1
+                tracking.freed_bytes += result["freed_bytes"]
+                tracking.errors += len(result["errors"])
+                tracking.members.append((self._plugin_names.get(plugin_id, plugin_id), result["freed_bytes"]))
+                if tracking.completed >= tracking.expected:
                     self._finalize_group_clean(group_id, tracking)
 
-    def _finalize_group_clean(self, group_id: str, tracking: dict) -> None:
+    def _finalize_group_clean(self, group_id: str, tracking: _GroupTrack) -> None:
         """Show aggregated clean status on the group expander row."""
         status = self._group_clean_status.get(group_id)
         if not status:
@@ -253,13 +283,8 @@ class _CleanController:
         spinner.set_spinning(False)
         spinner.set_visible(False)
 
-        if tracking["errors"] > 0:
-            check_img.set_from_icon_name("dialog-warning-symbolic")
-            check_img.add_css_class("warning")
-        else:
-            check_img.set_from_icon_name("emblem-ok-symbolic")
-            check_img.add_css_class("success")
-        label.set_label(f"Freed {bytes_to_human(tracking['freed_bytes'])}")
+        _apply_status(check_img, tracking.errors == 0)
+        label.set_label(f"Freed {bytes_to_human(tracking.freed_bytes)}")
 
         check_img.set_visible(True)
         label.set_visible(True)
@@ -267,13 +292,16 @@ class _CleanController:
         # Update subtitle with cleaned member summary
         expander = self._view._expander_rows.get(group_id)
         if expander:
-            parts = [f"{m['name']} \u2014 {bytes_to_human(m['freed_bytes'])}" for m in tracking["members"]]
+            parts = [f"{name} \u2014 {bytes_to_human(freed)}" for name, freed in tracking.members]
             expander.set_subtitle(", ".join(parts))
 
     def _on_all_clean_complete(self, results: list[dict]) -> None:
         view = self._view
         self._clean_done = True
 
+        # Apply results whose idle drain has not run yet
+        self._results.drain()
+
         # Stop progress animation, keep banner visible with success summary
         view._progress_spinner.set_spinning(False)
         view._progress_bar_row.set_visible(False)
@@ -302,14 +330,17 @@ class _CleanController:
         view._toolbar_revealer.set_reveal_child(False)
 
         # Post-clean UI cleanup — collapse, hide checkboxes and browse buttons
+        # (skip widgets already in the target state to avoid needless relayouts)
         for expander in view._expander_rows.values():
-            if expander.get_visible():
+            if expander.get_visible() and expander.get_expanded():
                 expander.set_expanded(False)
         view._selection.hide_all()
-        for btn in view._browse_buttons:
-            btn.set_visible(False)
-        for lbl in view._size_labels:
-            lbl.set_visible(False)
+        for widget in (*view._browse_buttons, *view._size_labels):
+            if widget.get_visible():
+                widget.set_visible(False)
 
+        view.window.invalidate_plugin_cache()
         view.window.dashboard_view.refresh()
-        view.window.modules_view.refresh()
+        # Not built until first visited; it lists fresh state then
+        if view.window.modules_view is not None:
+            view.window.modules_view.refresh()
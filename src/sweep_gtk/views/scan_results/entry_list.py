@@ -0,0 +1,182 @@
+"""Scan entry selection items and the virtualized list for large modules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+
+from gi.repository import Gio, GObject, Gtk, Pango
+
+from sweep_gtk.views.scan_results.helpers import _format_size
+from sweep_gtk.widgets import flat_icon_button, reveal_in_file_manager, show_file_browser
+
+if TYPE_CHECKING:
+    from sweep_gtk.window import SweepWindow
+
+# Height cap for the embedded list; rows beyond it are recycled while scrolling
+_MAX_LIST_HEIGHT = 400
+
+
+class ScanEntryItem(GObject.Object):
+    """Selection state and display data for a single scan entry.
+
+    Created for every entry up front, independently of whether its row
+    has been built yet.  Exposes ``get_active``/``set_active`` and ``get_visible``/``set_visible``
+    so *_SelectionState* can track it exactly like an entry ``Gtk.CheckButton``.
+    Both setters only write on change, mirroring the button's ``toggled``
+    semantics for ``notify::active`` listeners.
+    """
+
+    __gtype_name__ = "SweepScanEntryItem"
+
+    active = GObject.Property(type=bool, default=True)
+    selectable = GObject.Property(type=bool, default=True)
+
+    def __init__(self, entry: dict) -> None:
+        super().__init__()
+        is_dir = entry.get("is_dir", False)
+        child_count = entry.get("child_count", 1)
+
+        self.path: str = entry["path"]
+        self.uri: str = entry["uri"]
+        self.title: str = entry["name"]
+        self.icon_name = "folder-symbolic" if is_dir else "text-x-generic-symbolic"
+        self.browsable: bool = is_dir and child_count > 0
+
+        if self.browsable:
+            self.subtitle = f"{child_count:,} file{'s' if child_count != 1 else ''}"
+        else:
+            self.subtitle = entry.get("description", "")
+
+        if is_dir and entry["size_bytes"] == 0:
+            self.size_text = "Empty folder"
+        else:
+            self.size_text = _format_size(entry["size_bytes"])
+
+    def get_active(self) -> bool:
+        return self.active
+
+    def set_active(self, active: bool) -> None:
+        if self.active != active:
+            self.active = active
+
+    def get_visible(self) -> bool:
+        return self.selectable
+
+    def set_visible(self, visible: bool) -> None:
+        if self.selectable != visible:
+            self.selectable = visible
+
+
+def create_entry_store(items: list[ScanEntryItem]) -> Gio.ListStore:
+    """Wrap *items* in a list model in a single splice."""
+    store = Gio.ListStore(item_type=ScanEntryItem)
+    store.splice(0, 0, items)
+    return store
+
+
+def create_entry_list(window: SweepWindow, store: Gio.ListStore) -> Gtk.ScrolledWindow:
+    """Build a height-capped ListView showing *store*'s items, recycling row widgets."""
+    factory = Gtk.SignalListItemFactory()
+    factory.connect("setup", _on_entry_setup, window)
+    factory.connect("bind", _on_entry_bind)
+    factory.connect("unbind", _on_entry_unbind)
+
+    list_view = Gtk.ListView(model=Gtk.NoSelection(model=store), factory=factory)
+
+    scrolled = Gtk.ScrolledWindow(
+        hscrollbar_policy=Gtk.PolicyType.NEVER,
+        propagate_natural_height=True,
+        max_content_height=_MAX_LIST_HEIGHT,
+    )
+    scrolled.set_child(list_view)
+    return scrolled
+
+
+def _on_entry_setup(factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem, window: SweepWindow) -> None:
+    """Create the reusable widgets for an entry row."""
+    box = Gtk.Box(spacing=12, margin_start=12, margin_end=12, margin_top=8, margin_bottom=8)
+
+    icon = Gtk.Image()
+    box.append(icon)
+
+    labels_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, hexpand=True, valign=Gtk.Align.CENTER)
+    title_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.MIDDLE)
+    labels_box.append(title_label)
+    subtitle_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END, css_classes=["caption", "dim-label"])
+    labels_box.append(subtitle_label)
+    box.append(labels_box)
+
+    size_label = Gtk.Label(valign=Gtk.Align.CENTER, css_classes=["numeric", "dim-label"])
+    box.append(size_label)
+
+    # Buttons and checkbox share one box so cleaning can hide them together
+    actions = Gtk.Box(spacing=6)
+
+    view_btn = flat_icon_button("view-list-symbolic", "Browse files")
+    view_btn.connect("clicked", _on_browse_clicked, window)
+    actions.append(view_btn)
+
+    fm_btn = flat_icon_button("folder-open-symbolic", "Open in File Manager")
+    fm_btn.connect("clicked", _on_reveal_clicked)
+    actions.append(fm_btn)
+
+    check = Gtk.CheckButton(valign=Gtk.Align.CENTER)
+    actions.append(check)
+    box.append(actions)
+
+    box._icon = icon
+    box._icon_name = None
+    box._title_label = title_label
+    box._subtitle_label = subtitle_label
+    box._size_label = size_label
+    box._actions = actions
+    box._view_btn = view_btn
+    box._fm_btn = fm_btn
+    box._check = check
+    box._bindings = []
+    list_item.set_child(box)
+
+
+def _on_entry_bind(factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+    """Show *list_item*'s entry in its recycled row widgets."""
+    item: ScanEntryItem = list_item.get_item()
+    box = list_item.get_child()
+
+    # Rows show one of two icons; resetting an unchanged one still reloads it
+    if box._icon_name != item.icon_name:
+        box._icon.set_from_icon_name(item.icon_name)
+        box._icon_name = item.icon_name
+    box._title_label.set_label(item.title)
+    box._subtitle_label.set_label(item.subtitle)
+    box._subtitle_label.set_visible(bool(item.subtitle))
+    box._size_label.set_label(item.size_text)
+    box._view_btn.set_visible(item.browsable)
+    box._fm_btn.set_visible(not item.browsable)
+    box._view_btn._path = item.path
+    box._fm_btn._uri = item.uri
+
+    flags = GObject.BindingFlags.SYNC_CREATE
+    box._bindings = [
+        item.bind_property("active", box._check, "active", flags | GObject.BindingFlags.BIDIRECTIONAL),
+        item.bind_property("selectable", box._actions, "visible", flags),
+    ]
+
+
+def _on_entry_unbind(factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+    """Detach the row widgets from the item they were showing."""
+    box = list_item.get_child()
+    for binding in box._bindings:
+        binding.unbind()
+    box._bindings = []
+
+
+def _on_browse_clicked(btn: Gtk.Button, window: SweepWindow) -> None:
+    show_file_browser(window, btn._path)
+
+
+def _on_reveal_clicked(btn: Gtk.Button) -> None:
+    reveal_in_file_manager(btn._uri)
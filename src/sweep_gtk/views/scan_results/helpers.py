@@ -1,10 +1,20 @@
-"""Helper functions for scan results formatting."""
+"""Helpers for scan results formatting and for handing worker results to the main loop."""
 
 from __future__ import annotations
 
-from pathlib import Path
+import threading
+from functools import lru_cache
+from typing import Any, Callable
 
+from gi.repository import GLib
 
+from sweep.utils import bytes_to_human
+
+# Row sizes repeat heavily across a scan (empty dirs, block-sized files)
+_format_size = lru_cache(maxsize=4096)(bytes_to_human)
+
+
+@lru_cache(maxsize=4096)
 def _format_counts(total_items: int, noun: str, entry_count: int) -> str:
     """Build the 'N items · M entries' part without size."""
     return (
@@ -13,18 +23,39 @@ def _format_counts(total_items: int, noun: str, entry_count: int) -> str:
     )
 
 
-def _common_parent(paths: list[Path]) -> Path:
-    """Find the deepest common parent directory for a list of paths."""
-    if not paths:
-        return Path("/")
-    if len(paths) == 1:
-        return paths[0].parent
-
-    common = paths[0].parent
-    for p in paths[1:]:
-        parent = p.parent
-        while common != parent and common != Path("/"):
-            if str(parent).startswith(str(common)):
-                break
-            common = common.parent
-    return common
+class _IdleQueue:
+    """Hand items from worker threads to the main loop in batches.
+
+    put() is thread-safe.  Only the first item put since the last drain
+    schedules an idle callback, which passes every item queued so far to
+    *on_batch*, so a burst of results wakes the main loop once.
+    """
+
+    def __init__(self, on_batch: Callable[[list[Any]], None]) -> None:
+        self._on_batch = on_batch
+        self._lock = threading.Lock()
+        self._items: list[Any] = []
+        self._scheduled = False
+
+    def put(self, item: Any) -> None:
+        """Queue *item* from any thread."""
+        with self._lock:
+            self._items.append(item)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        GLib.idle_add(self.drain)
+
+    def drain(self) -> bool:
+        """Pass the queued items to *on_batch* now (main loop only)."""
+        with self._lock:
+            items, self._items = self._items, []
+            self._scheduled = False
+        if items:
+            self._on_batch(items)
+        return GLib.SOURCE_REMOVE
+
+    def clear(self) -> None:
+        """Drop the queued items."""
+        with self._lock:
+            self._items.clear()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Callable
 
 import gi
@@ -11,19 +13,36 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
 
+@dataclass(slots=True)
+class _EntryInfo:
+    """Selection-tracking info for one scan entry."""
+
+    plugin_id: str
+    plugin_name: str
+    path: str
+    size_bytes: int
+    requires_root: bool
+
+
 class _SelectionState:
     """Tracks checkbox state for scan result selection.
 
     Owns the three check-tracking lists and all toggle/query logic.
     Calls *on_changed* whenever the selection changes so the parent
     view can refresh its summary label and clean button.
+
+    Entry "checks" are ``ScanEntryItem`` model items that expose the
+    active/visible accessors of a ``Gtk.CheckButton``; the entry rows,
+    built lazily, bind their checkboxes to them.
     """
 
     def __init__(self, on_changed: Callable[[], None]) -> None:
         self._on_changed = on_changed
-        self._module_checks: list[tuple[Gtk.CheckButton, str, list[Gtk.CheckButton]]] = []
-        self._entry_checks: list[tuple[Gtk.CheckButton, dict]] = []
-        self._group_checks: list[tuple[Gtk.CheckButton, list[Gtk.CheckButton]]] = []
+        # Module and group tuples carry the "toggled" handler ID so it can be
+        # blocked directly instead of searching handlers by function.
+        self._module_checks: list[tuple[Gtk.CheckButton, str, list[Gtk.CheckButton], int]] = []
+        self._entry_checks: list[tuple[Gtk.CheckButton, _EntryInfo]] = []
+        self._group_checks: list[tuple[Gtk.CheckButton, list[Gtk.CheckButton], int]] = []
 
     # -- Mutators --
 
@@ -32,14 +51,16 @@ class _SelectionState:
         self._entry_checks.clear()
         self._group_checks.clear()
 
-    def add_module(self, check: Gtk.CheckButton, plugin_id: str, child_checks: list[Gtk.CheckButton]) -> None:
-        self._module_checks.append((check, plugin_id, child_checks))
+    def add_module(
+        self, check: Gtk.CheckButton, plugin_id: str, child_checks: list[Gtk.CheckButton], handler_id: int
+    ) -> None:
+        self._module_checks.append((check, plugin_id, child_checks, handler_id))
 
-    def add_entry(self, check: Gtk.CheckButton, info: dict) -> None:
+    def add_entry(self, check: Gtk.CheckButton, info: _EntryInfo) -> None:
         self._entry_checks.append((check, info))
 
-    def add_group(self, check: Gtk.CheckButton, module_checks: list[Gtk.CheckButton]) -> None:
-        self._group_checks.append((check, module_checks))
+    def add_group(self, check: Gtk.CheckButton, module_checks: list[Gtk.CheckButton], handler_id: int) -> None:
+        self._group_checks.append((check, module_checks, handler_id))
 
     @property
     def has_modules(self) -> bool:
@@ -47,12 +68,10 @@ class _SelectionState:
 
     def remove_plugin_ids(self, plugin_ids: set[str]) -> None:
         """Remove all tracking entries for the given plugin IDs (streaming rebuild)."""
-        rendered_check_ids = {id(c) for c, pid, _ in self._module_checks if pid in plugin_ids}
-        self._group_checks = [
-            (gc, mc) for gc, mc in self._group_checks if not any(id(c) in rendered_check_ids for c in mc)
-        ]
-        self._module_checks = [(c, pid, cc) for c, pid, cc in self._module_checks if pid not in plugin_ids]
-        self._entry_checks = [(c, info) for c, info in self._entry_checks if info["plugin_id"] not in plugin_ids]
+        rendered_check_ids = {id(c) for c, pid, _, _ in self._module_checks if pid in plugin_ids}
+        self._group_checks = [g for g in self._group_checks if not any(id(c) in rendered_check_ids for c in g[1])]
+        self._module_checks = [m for m in self._module_checks if m[1] not in plugin_ids]
+        self._entry_checks = [(c, info) for c, info in self._entry_checks if info.plugin_id not in plugin_ids]
 
     # -- Checkbox handlers --
 
@@ -60,16 +79,16 @@ class _SelectionState:
         """Select or deselect all entry checkboxes."""
         for check, _ in self._entry_checks:
             check.set_active(active)
-        for module_check, _, _ in self._module_checks:
-            module_check.handler_block_by_func(self.on_module_toggled)
+        for module_check, _, _, handler_id in self._module_checks:
+            module_check.handler_block(handler_id)
             module_check.set_active(active)
             module_check.set_inconsistent(False)
-            module_check.handler_unblock_by_func(self.on_module_toggled)
-        for group_check, _ in self._group_checks:
-            group_check.handler_block_by_func(self.on_group_toggled)
+            module_check.handler_unblock(handler_id)
+        for group_check, _, handler_id in self._group_checks:
+            group_check.handler_block(handler_id)
             group_check.set_active(active)
             group_check.set_inconsistent(False)
-            group_check.handler_unblock_by_func(self.on_group_toggled)
+            group_check.handler_unblock(handler_id)
         self._on_changed()
 
     def on_group_toggled(self, group_check: Gtk.CheckButton, module_checks: list[Gtk.CheckButton]) -> None:
@@ -88,25 +107,25 @@ class _SelectionState:
 
     def on_entry_toggled(self, check: Gtk.CheckButton) -> None:
         """Update module and group checkboxes and summary when an entry is toggled."""
-        for module_check, _, child_checks in self._module_checks:
+        for module_check, _, child_checks, handler_id in self._module_checks:
             all_active = all(c.get_active() for c in child_checks)
             any_active = any(c.get_active() for c in child_checks)
-            module_check.handler_block_by_func(self.on_module_toggled)
+            module_check.handler_block(handler_id)
             module_check.set_active(all_active)
             module_check.set_inconsistent(any_active and not all_active)
-            module_check.handler_unblock_by_func(self.on_module_toggled)
+            module_check.handler_unblock(handler_id)
         self._update_group_checks()
         self._on_changed()
 
     def _update_group_checks(self) -> None:
         """Recompute group checkbox states from their module checks."""
-        for group_check, module_checks in self._group_checks:
+        for group_check, module_checks, handler_id in self._group_checks:
             all_on = all(c.get_active() and not c.get_inconsistent() for c in module_checks)
             any_on = any(c.get_active() or c.get_inconsistent() for c in module_checks)
-            group_check.handler_block_by_func(self.on_group_toggled)
+            group_check.handler_block(handler_id)
             group_check.set_active(all_on)
             group_check.set_inconsistent(any_on and not all_on)
-            group_check.handler_unblock_by_func(self.on_group_toggled)
+            group_check.handler_unblock(handler_id)
 
     # -- Queries --
 
@@ -115,22 +134,37 @@ class _SelectionState:
 
         Returns dict with total_size, total_items, and per-module breakdown.
         """
+        return self._collect(with_entries=False)[1]
+
+    def get_clean_payload(self) -> tuple[dict[str, list[dict]], dict]:
+        """Return (entries_by_plugin, selection_info) from a single pass over the checkboxes.
+
+        *entries_by_plugin* holds the per-plugin entry lists for the clean
+        operation; *selection_info* matches get_selection_info().
+        """
+        return self._collect(with_entries=True)
+
+    def _collect(self, *, with_entries: bool) -> tuple[dict[str, list[dict]], dict]:
+        """Walk active entry checkboxes once, building entry lists and the module breakdown."""
+        entries_by_plugin: dict[str, list[dict]] = defaultdict(list)
         modules: dict[str, dict] = {}
 
         for check, info in self._entry_checks:
             if not check.get_active():
                 continue
-            name = info["plugin_name"]
+            if with_entries:
+                entries_by_plugin[info.plugin_id].append({"path": info.path, "size_bytes": info.size_bytes})
+            name = info.plugin_name
             if name not in modules:
                 modules[name] = {
                     "size": 0,
                     "check_ids": set(),
-                    "requires_root": info.get("requires_root", False),
+                    "requires_root": info.requires_root,
                 }
-            modules[name]["size"] += info["size_bytes"]
+            modules[name]["size"] += info.size_bytes
             modules[name]["check_ids"].add(id(check))
 
-        return {
+        info = {
             "total_size": sum(m["size"] for m in modules.values()),
             "total_items": sum(len(m["check_ids"]) for m in modules.values()),
             "modules": [
@@ -143,23 +177,15 @@ class _SelectionState:
                 for name, m in modules.items()
             ],
         }
-
-    def get_entries_by_plugin(self) -> dict[str, list[dict]]:
-        """Build per-plugin entry lists from active checkboxes for the clean operation."""
-        entries_by_plugin: dict[str, list[dict]] = {}
-        for check, info in self._entry_checks:
-            if not check.get_active():
-                continue
-            entries_by_plugin.setdefault(info["plugin_id"], []).append(
-                {"path": info["path"], "size_bytes": info["size_bytes"]}
-            )
-        return entries_by_plugin
+        return entries_by_plugin, info
 
     def hide_all(self) -> None:
-        """Hide all checkboxes (post-clean)."""
-        for check, _ in self._entry_checks:
-            check.set_visible(False)
-        for check, _, _ in self._module_checks:
-            check.set_visible(False)
-        for check, _ in self._group_checks:
-            check.set_visible(False)
+        """Hide all checkboxes (post-clean), skipping ones already hidden."""
+        checks = (
+            *(c for c, _ in self._entry_checks),
+            *(c for c, _, _, _ in self._module_checks),
+            *(c for c, _, _ in self._group_checks),
+        )
+        for check in checks:
+            if check.get_visible():
+                check.set_visible(False)
@@ -2,37 +2,133 @@
 
 from __future__ import annotations
 
+import bisect
 import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterator
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, Gio, GObject, Gtk, GLib
 
 from sweep.settings import Settings
-from sweep.utils import bytes_to_human, format_elapsed as _format_elapsed
+from sweep.utils import format_elapsed as _format_elapsed
 from sweep_gtk.constants import CATEGORY_LABELS
 from sweep_gtk.widgets import (
+    flat_icon_button,
     icon_label as _icon_label,
     reveal_in_file_manager,
     show_dirs_browser,
     show_file_browser,
     show_leaf_browser,
 )
-from sweep_gtk.views.scan_results.helpers import _format_counts, _common_parent
-from sweep_gtk.views.scan_results.selection import _SelectionState
+from sweep_gtk.views.scan_results.entry_list import ScanEntryItem, create_entry_list, create_entry_store
+from sweep_gtk.views.scan_results.helpers import _IdleQueue, _format_counts, _format_size
+from sweep_gtk.views.scan_results.selection import _EntryInfo, _SelectionState
 from sweep_gtk.views.scan_results.clean_controller import _CleanController
 
 _SORT_KEY = "results.sort_by_size"
 
+# Top-level rows (modules or groups) built per main-loop iteration
+_POPULATE_CHUNK = 8
+
+# Modules with more entries than this list them in a virtualized ListView
+_LIST_VIEW_THRESHOLD = 200
+
+# Display position of each known category; unknown categories sort after them
+_CATEGORY_ORDER = {cat_id: i for i, cat_id in enumerate(CATEGORY_LABELS)}
+_UNKNOWN_CATEGORY_RANK = len(_CATEGORY_ORDER)
+# Rank of page groups that are not categories (Nothing Found, Scan Errors)
+_OTHER_GROUP_RANK = _UNKNOWN_CATEGORY_RANK + 1
+
+# Pixel size of row prefix icons (GTK's normal icon size)
+_ICON_SIZE = 16
+
 if TYPE_CHECKING:
     from sweep_gtk.window import SweepWindow
 
 
+@dataclass(slots=True)
+class _GroupTotals:
+    """Running totals of a streamed group's non-empty members."""
+
+    bytes: int = 0
+    files: int = 0
+    entries: int = 0
+
+    def add(self, result: dict) -> None:
+        self.bytes += result["total_bytes"]
+        self.files += result["total_files"]
+        self.entries += result["file_count"]
+
+
+def _order_key(result: dict) -> tuple[int, str]:
+    """Return the default display order of *result*: plugin sort order, then name."""
+    return result.get("sort_order", 50), result["sort_name"]
+
+
+# Sort keys of _category_children entries: (size_bytes, sort_order, name, widget)
+_child_order_key = itemgetter(1, 2)
+
+
+def _child_size_key(child: tuple[int, int, str, Gtk.Widget]) -> tuple[int, str]:
+    return -child[0], child[2]
+
+
+@contextmanager
+def _frozen(widget: Gtk.Widget) -> Iterator[None]:
+    """Batch property-change notifications on *widget* while its children are built or moved."""
+    widget.freeze_notify()
+    try:
+        yield
+    finally:
+        widget.thaw_notify()
+
+
+def _unchanged_prefix(current: list, ordered: list) -> int:
+    """Return how many leading items *current* and *ordered* have in common (by identity)."""
+    for i, (a, b) in enumerate(zip(current, ordered)):
+        if a is not b:
+            return i
+    return len(ordered)
+
+
+# Results split for display: (errored, empty, by_category, total_bytes) where
+# by_category maps cat_id -> (standalone results, group_id -> member results)
+_Partition = tuple[list[dict], list[dict], dict[str, tuple[list[dict], dict[str, list[dict]]]], int]
+
+
+def _partition_results(results: list[dict]) -> _Partition:
+    """Split *results* into errored, empty and per-category actionable results in one pass."""
+    total_bytes = 0
+    errored: list[dict] = []
+    empty: list[dict] = []
+    by_category: dict[str, tuple[list[dict], dict[str, list[dict]]]] = defaultdict(lambda: ([], defaultdict(list)))
+    for result in results:
+        total_bytes += result["total_bytes"]
+        if result.get("error"):
+            errored.append(result)
+        if result["total_bytes"] == 0:
+            if not result.get("error"):
+                empty.append(result)
+            continue
+        standalone, grouped = by_category[result.get("category", "user")]
+        group = result.get("group")
+        if group:
+            grouped[group["id"]].append(result)
+        else:
+            standalone.append(result)
+    return errored, empty, by_category, total_bytes
+
+
 class ScanResultsView(Gtk.Box):
     """View showing scan results with per-item selection."""
 
@@ -40,11 +136,33 @@ class ScanResultsView(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.window = window
         self._scan_results: list[dict] = []
+        # (results, length, partition) of the last populate(), reused while the same list
+        # has not grown; in-place streaming appends also clear it
+        self._partition: tuple[list[dict], int, _Partition] | None = None
+        # Aggregates of _scan_results: the total is kept by both populate() and
+        # streaming, the counts only while streaming (for the completion banner)
+        self._total_bytes: int = 0
+        self._module_count: int = 0
+        self._error_count: int = 0
         self._selection = _SelectionState(on_changed=self._update_summary)
         self._clean = _CleanController(self)
         self._groups: list[Adw.PreferencesGroup] = []
         self._sort_by_size: bool = Settings.instance().get(_SORT_KEY, False)
 
+        # Icon theme lookups shared by every row showing the same icon, and the
+        # row images using them, re-set when the scale factor or icon theme changes
+        self._icon_paintables: dict[str, Gtk.IconPaintable] = {}
+        self._icon_images: list[tuple[Gtk.Image, str]] = []
+        window.connect("notify::scale-factor", self._on_icons_changed)
+        Gtk.IconTheme.get_for_display(window.get_display()).connect("changed", self._on_icons_changed)
+
+        # Signal handlers connected while building rows, disconnected when the rows are discarded
+        self._row_handlers: list[tuple[GObject.Object, int]] = []
+
+        # Deferred row construction, drained by an idle source between frames
+        self._pending_work: deque[Callable[[], None]] = deque()
+        self._work_source_id: int | None = None
+
         # Streaming scan state
         self._show_empty_results: bool = True
         self._scan_start_time: float = 0.0
@@ -52,10 +170,14 @@ class ScanResultsView(Gtk.Box):
         self._scan_total: int = 0
         self._scan_completed: int = 0
         self._scan_generation: int = 0
-        self._group_pending: dict[str, list[dict]] = {}
+        self._group_pending: dict[str, list[dict]] = defaultdict(list)
         self._group_expected: dict[str, int] = {}
-        self._group_widgets: dict[str, Adw.PreferencesGroup] = {}
+        self._group_totals: dict[str, _GroupTotals] = defaultdict(_GroupTotals)
+        # Streamed group rows: the category they were inserted under and their entry in _category_children
+        self._group_widgets: dict[str, tuple[str, tuple[int, int, str, Gtk.Widget]]] = {}
         self._empty_results: list[dict] = []
+        # Results posted by scan threads, added to the page by one idle callback per burst
+        self._posted = _IdleQueue(self._on_posted_results)
 
         # Track expander rows for expanded-state preservation across re-sorts
         # Keys are plugin_id (standalone modules) or group_id (group expanders)
@@ -64,10 +186,20 @@ class ScanResultsView(Gtk.Box):
 
         # Category-based PreferencesGroups (mirrors Modules view layout)
         self._category_groups: dict[str, Adw.PreferencesGroup] = {}
+        # Display rank of each streamed category group, keyed by id(group)
+        self._group_ranks: dict[int, int] = {}
 
         # Per-category sorted children for streaming insertion order
         # Maps cat_id -> list of (size_bytes, sort_order, name, widget) tuples
-        self._category_children: dict[str, list[tuple[int, int, str, Gtk.Widget]]] = {}
+        self._category_children: dict[str, list[tuple[int, int, str, Gtk.Widget]]] = defaultdict(list)
+        # Same tuples for the member rows of each completed plugin group
+        self._group_member_rows: dict[str, list[tuple[int, int, str, Gtk.Widget]]] = {}
+        # plugin_id -> (result, entry row or item keyed by id(entry), container)
+        # where the container is the module's ExpanderRow or its ListView model,
+        # or None (and the values are items) until the module is first expanded
+        self._module_entries: dict[
+            str, tuple[dict, dict[int, Adw.ActionRow | ScanEntryItem], Adw.ExpanderRow | Gio.ListStore | None]
+        ] = {}
 
         # Post-clean UI tracking
         self._browse_buttons: list[Gtk.Button] = []
@@ -100,15 +232,15 @@ class ScanResultsView(Gtk.Box):
         )
         safe_scan_btn = Gtk.Button(
             child=_icon_label("security-high-symbolic", "Safe Scan"),
+            css_classes=["pill"],
         )
-        safe_scan_btn.add_css_class("pill")
         safe_scan_btn.connect("clicked", self._on_safe_scan)
         empty_buttons.append(safe_scan_btn)
 
         full_scan_btn = Gtk.Button(
             child=_icon_label("edit-select-all-symbolic", "Full Scan"),
+            css_classes=["pill"],
         )
-        full_scan_btn.add_css_class("pill")
         full_scan_btn.connect("clicked", self._on_full_scan)
         empty_buttons.append(full_scan_btn)
 
@@ -125,8 +257,7 @@ class ScanResultsView(Gtk.Box):
         self.action_bar.set_visible(False)
         self.append(self.action_bar)
 
-        self.summary_label = Gtk.Label(label="")
-        self.summary_label.add_css_class("heading")
+        self.summary_label = Gtk.Label(label="", css_classes=["heading"])
         self.action_bar.pack_start(self.summary_label)
 
         self.clean_btn = Gtk.Button(label="Clean Selected")
@@ -134,31 +265,85 @@ class ScanResultsView(Gtk.Box):
         self.clean_btn.connect("clicked", self._clean.on_clean_clicked)
         self.action_bar.pack_end(self.clean_btn)
 
+    @property
+    def total_bytes(self) -> int:
+        """Total reclaimable bytes across the current scan results."""
+        return self._total_bytes
+
     def _on_safe_scan(self, button: Gtk.Button) -> None:
         """Launch a scan with only safe-risk plugins."""
-        plugins = self.window.client.list_plugins()
+        plugins = self.window.cached_list_plugins()
         safe_ids = [p["id"] for p in plugins if p["available"] and p["risk_level"] == "safe"]
         self.window.launch_scan(safe_ids)
 
     def _on_full_scan(self, button: Gtk.Button) -> None:
         """Launch a scan with all available plugins."""
-        plugins = self.window.client.list_plugins()
+        plugins = self.window.cached_list_plugins()
         all_ids = [p["id"] for p in plugins if p["available"]]
         self.window.launch_scan(all_ids)
 
     def _get_or_create_category_group(self, cat_id: str) -> Adw.PreferencesGroup:
-        """Get an existing category group or create a new one."""
+        """Get an existing category group or create one at its place on the page.
+
+        Groups are kept in CATEGORY_LABELS order, unknown categories last in
+        arrival order, so only the groups after a new one need to be moved.
+        """
         if cat_id in self._category_groups:
             return self._category_groups[cat_id]
 
         cat_group = Adw.PreferencesGroup(
             title=CATEGORY_LABELS.get(cat_id, cat_id.replace("_", " ").title()),
         )
-        self.prefs_page.add(cat_group)
-        self._groups.append(cat_group)
+        rank = _CATEGORY_ORDER.get(cat_id, _UNKNOWN_CATEGORY_RANK)
+        ranks = self._group_ranks
+        index = bisect.bisect_right(self._groups, rank, key=lambda g: ranks.get(id(g), _OTHER_GROUP_RANK))
+        self._groups.insert(index, cat_group)
+        self._group_ranks[id(cat_group)] = rank
         self._category_groups[cat_id] = cat_group
+
+        self.prefs_page.add(cat_group)
+        for group in self._groups[index + 1 :]:
+            self.prefs_page.remove(group)
+            self.prefs_page.add(group)
         return cat_group
 
+    def _connect_row(self, obj: GObject.Object, signal: str, callback: Callable, *args) -> int:
+        """Connect a handler on a result row widget or item, recording it for _disconnect_rows()."""
+        handler_id = obj.connect(signal, callback, *args)
+        self._row_handlers.append((obj, handler_id))
+        return handler_id
+
+    def _disconnect_rows(self) -> None:
+        """Disconnect all row handlers and drop tracked row images so discarded rows are not kept alive."""
+        for obj, handler_id in self._row_handlers:
+            if obj.handler_is_connected(handler_id):
+                obj.disconnect(handler_id)
+        self._row_handlers.clear()
+        self._icon_images.clear()
+
+    def _icon_paintable(self, icon_name: str) -> Gtk.IconPaintable:
+        """Return the row-sized paintable for *icon_name*, resolving each icon only once."""
+        paintable = self._icon_paintables.get(icon_name)
+        if paintable is None:
+            theme = Gtk.IconTheme.get_for_display(self.window.get_display())
+            paintable = theme.lookup_icon(
+                icon_name, None, _ICON_SIZE, self.window.get_scale_factor(), Gtk.TextDirection.NONE, 0
+            )
+            self._icon_paintables[icon_name] = paintable
+        return paintable
+
+    def _icon_image(self, icon_name: str) -> Gtk.Image:
+        """Create a row-sized image for *icon_name*, tracked until the rows are discarded."""
+        image = Gtk.Image.new_from_paintable(self._icon_paintable(icon_name))
+        self._icon_images.append((image, icon_name))
+        return image
+
+    def _on_icons_changed(self, *_args) -> None:
+        """Look the icons up again and update the images of existing rows."""
+        self._icon_paintables.clear()
+        for image, icon_name in self._icon_images:
+            image.set_from_paintable(self._icon_paintable(icon_name))
+
     def _wrap_in_group(self, widget: Gtk.Widget) -> Adw.PreferencesGroup:
         group = Adw.PreferencesGroup()
         group.add(widget)
@@ -170,9 +355,7 @@ class ScanResultsView(Gtk.Box):
         """Add hidden spinner + checkmark + label for clean progress."""
         spinner = Gtk.Spinner(visible=False, valign=Gtk.Align.CENTER)
         check_img = Gtk.Image(visible=False, valign=Gtk.Align.CENTER)
-        label = Gtk.Label(visible=False, valign=Gtk.Align.CENTER)
-        label.add_css_class("caption")
-        label.add_css_class("dim-label")
+        label = Gtk.Label(visible=False, valign=Gtk.Align.CENTER, css_classes=["caption", "dim-label"])
         # ExpanderRow stacks suffixes right-to-left; reverse order so
         # the visual result matches ActionRow: [spinner] [✓] [label]
         if isinstance(row, Adw.ExpanderRow):
@@ -246,28 +429,63 @@ class ScanResultsView(Gtk.Box):
         self._toolbar_revealer.set_child(toolbar_clamp)
 
     def _on_sort_toggled(self, button: Gtk.ToggleButton) -> None:
-        """Re-populate the view when sort toggle changes."""
+        """Re-order the view when the sort toggle changes, rebuilding only if rows are still pending."""
         self._sort_by_size = button.get_active()
         Settings.instance().set(_SORT_KEY, self._sort_by_size)
 
-        if self._scanning:
-            # Re-sort existing items in all categories without full rebuild
-            for cat_id in self._category_children:
-                self._sort_category_items(cat_id)
+        if self._scanning or not self._pending_work:
+            # Every row already exists — re-order them instead of rebuilding
+            with _frozen(self.prefs_page):
+                for plugin_id in self._module_entries:
+                    self._sort_module_entries(plugin_id)
+                for group_id in self._group_member_rows:
+                    self._sort_group_members(group_id)
+                for cat_id in self._category_children:
+                    self._sort_category_items(cat_id)
             return
 
-        # Save expanded state so rows are created already expanded/collapsed
-        self._saved_expanded = {key: row.get_expanded() for key, row in self._expander_rows.items()}
-        self.populate(self._scan_results)
-        self._saved_expanded = {}
+        # Rebuild with the current expanded state so rows are created already expanded/collapsed
+        expanded = {key: row.get_expanded() for key, row in self._expander_rows.items()}
+        self.populate(self._scan_results, expanded)
+
+    def populate(self, results: list[dict], expanded: dict[str, bool] | None = None) -> None:
+        """Populate the view with scan results.
 
-    def populate(self, results: list[dict]) -> None:
-        """Populate the view with scan results."""
+        Category groups are created immediately; their rows are built
+        incrementally from an idle callback so large results do not block
+        the main loop.  The page is hidden and its notifications frozen
+        during the synchronous part so GTK lays it out once.
+
+        Args:
+            results: Scan results to show.
+            expanded: Expanded state to restore, keyed by plugin or group id.
+        """
+        page = self.prefs_page
+        with _frozen(page):
+            page.set_visible(False)
+            try:
+                self._rebuild(results, expanded)
+            finally:
+                page.set_visible(True)
+
+    def _rebuild(self, results: list[dict], expanded: dict[str, bool] | None = None) -> None:
+        """Clear the page and build widgets for *results*, restoring *expanded* rows."""
+        self._cancel_pending_work()
+        if expanded:
+            self._saved_expanded = expanded
+        # Results still posted by a streaming scan belong to the page being replaced
+        self._cancel_stream_flush()
+        self._scan_generation += 1
+        self._disconnect_rows()
         self._scan_results = results
         self._selection.clear()
         self._expander_rows.clear()
         self._clean.clear()
         self._category_groups.clear()
+        self._group_ranks.clear()
+        self._category_children.clear()
+        self._group_member_rows.clear()
+        self._module_entries.clear()
         self._browse_buttons.clear()
         self._size_labels.clear()
         self._plugin_rows.clear()
@@ -280,11 +498,12 @@ class ScanResultsView(Gtk.Box):
             self.prefs_page.remove(group)
         self._groups.clear()
 
-        actionable = [r for r in results if r["total_bytes"] > 0]
-        errored = [r for r in results if r.get("error")]
-        empty = [r for r in results if r["total_bytes"] == 0 and not r.get("error")]
+        cached = self._partition
+        if cached is None or cached[0] is not results or cached[1] != len(results):
+            cached = self._partition = (results, len(results), _partition_results(results))
+        errored, empty, by_category, self._total_bytes = cached[2]
 
-        if not actionable and not empty and not errored:
+        if not by_category and not empty and not errored:
             self._empty_group = self._wrap_in_group(self.empty_status)
             self.prefs_page.add(self._empty_group)
             self._groups.append(self._empty_group)
@@ -292,23 +511,10 @@ class ScanResultsView(Gtk.Box):
             self._toolbar_revealer.set_reveal_child(False)
             return
 
-        # Group actionable results by category, then by plugin group vs standalone
-        by_category: dict[str, list[dict]] = {}
-        for result in actionable:
-            cat = result.get("category", "user")
-            by_category.setdefault(cat, []).append(result)
-
-        # Build category groups in CATEGORY_LABELS order (matching Modules view)
-        for cat_id in CATEGORY_LABELS:
-            cat_results = by_category.get(cat_id)
-            if not cat_results:
-                continue
-            self._populate_category(cat_id, cat_results)
-
-        # Handle any categories not in CATEGORY_LABELS
-        for cat_id, cat_results in by_category.items():
-            if cat_id not in CATEGORY_LABELS:
-                self._populate_category(cat_id, cat_results)
+        # Build category groups in CATEGORY_LABELS order (matching Modules view),
+        # followed by unknown categories in the order they were found
+        for cat_id in sorted(by_category, key=lambda c: _CATEGORY_ORDER.get(c, _UNKNOWN_CATEGORY_RANK)):
+            self._populate_category(cat_id, *by_category[cat_id])
 
         if empty and self._show_empty_results:
             self._populate_empty_plugins(empty)
@@ -316,13 +522,13 @@ class ScanResultsView(Gtk.Box):
         if errored:
             self._populate_errored_plugins(errored)
 
-        has_actionable = bool(actionable)
+        has_actionable = bool(by_category)
         self.action_bar.set_visible(has_actionable)
         self._toolbar_revealer.set_reveal_child(has_actionable)
         self._update_summary()
 
-    def _populate_category(self, cat_id: str, results: list[dict]) -> None:
-        """Populate a single category group with its results."""
+    def _populate_category(self, cat_id: str, standalone: list[dict], grouped: dict[str, list[dict]]) -> None:
+        """Populate a single category group with its standalone and grouped results."""
         cat_group = Adw.PreferencesGroup(
             title=CATEGORY_LABELS.get(cat_id, cat_id.replace("_", " ").title()),
         )
@@ -330,55 +536,94 @@ class ScanResultsView(Gtk.Box):
         self._groups.append(cat_group)
         self._category_groups[cat_id] = cat_group
 
-        for result in results:
-            self._plugin_to_cat[result["plugin_id"]] = cat_id
+        by_size = self._sort_by_size
 
-        # Partition into plugin groups and standalone
-        grouped: dict[str, list[dict]] = {}
-        standalone: list[dict] = []
-        for result in results:
-            g = result.get("group")
-            if g:
-                grouped.setdefault(g["id"], []).append(result)
-            else:
-                standalone.append(result)
-
-        # Build top-level items with sort keys for ordering within category
-        top_items: list[tuple[tuple, str, object]] = []
-        for group_id, member_results in grouped.items():
-            if self._sort_by_size:
-                member_results.sort(key=lambda r: r["total_bytes"], reverse=True)
-            else:
-                member_results.sort(key=lambda r: (r.get("sort_order", 50), r["plugin_name"].lower()))
-            group_total = sum(r["total_bytes"] for r in member_results)
-            best = member_results[0]
-            if self._sort_by_size:
-                sort_key = (-group_total, best["plugin_name"].lower())
-            else:
-                sort_key = (best.get("sort_order", 50), best["plugin_name"].lower())
-            top_items.append((sort_key, "group", member_results))
+        def sort_key(r: dict) -> tuple:
+            return (-r["total_bytes"], r["sort_name"]) if by_size else _order_key(r)
 
+        # Each top-level item: (row builder, row key, data, child metadata)
+        top_items: list[tuple[Callable, str, object, tuple[int, int, str]]] = []
         for result in standalone:
-            if self._sort_by_size:
-                sort_key = (-result["total_bytes"], result["plugin_name"].lower())
-            else:
-                sort_key = (result.get("sort_order", 50), result["plugin_name"].lower())
-            top_items.append((sort_key, "standalone", result))
+            plugin_id = result["plugin_id"]
+            self._plugin_to_cat[plugin_id] = cat_id
+            meta = (result["total_bytes"], result.get("sort_order", 50), result["sort_name"])
+            top_items.append((self._populate_simple_plugin, plugin_id, result, meta))
+
+        # A group sorts by its total size, or by its first member's position
+        for group_id, members in grouped.items():
+            for result in members:
+                self._plugin_to_cat[result["plugin_id"]] = cat_id
+            member_results = sorted(members, key=sort_key)
+            group_total = sum(r["total_bytes"] for r in member_results)
+            first = min(member_results, key=_order_key)
+            meta = (group_total, first.get("sort_order", 50), first["sort_name"])
+            top_items.append((self._populate_group_result, group_id, member_results, meta))
+
+        # Same order as _category_children, so streamed inserts and removals find their rows
+        child_key = self._child_key
+        top_items.sort(key=lambda item: child_key(item[3]))
+
+        for populate_fn, row_key, data, meta in top_items:
+            self._schedule(partial(self._populate_deferred, populate_fn, data, cat_id, row_key, meta))
+
+    def _populate_deferred(
+        self,
+        populate_fn: Callable,
+        data: object,
+        cat_id: str,
+        row_key: str,
+        meta: tuple[int, int, str],
+    ) -> None:
+        """Run a deferred row builder and track its row for in-place re-sorting.
 
-        top_items.sort(key=lambda x: x[0])
+        Items are scheduled in display order, so appending to
+        _category_children keeps it sorted.
+        """
+        cat_group = self._category_groups[cat_id]
+        with _frozen(cat_group):
+            populate_fn(data, cat_group)
+        self._category_children[cat_id].append((*meta, self._expander_rows[row_key]))
+
+    # -- Deferred row construction --
+
+    def _schedule(self, work: Callable[[], None]) -> None:
+        """Queue *work* to run from the idle source, installing it if needed."""
+        self._pending_work.append(work)
+        if self._work_source_id is None:
+            self._work_source_id = GLib.idle_add(self._run_pending_work)
+
+    def _cancel_pending_work(self) -> None:
+        """Drop queued row construction (the widgets it targets are being discarded)."""
+        self._pending_work.clear()
+        self._saved_expanded = {}
+        if self._work_source_id is not None:
+            GLib.source_remove(self._work_source_id)
+            self._work_source_id = None
+
+    def _run_pending_work(self) -> bool:
+        """Build up to _POPULATE_CHUNK queued items, then yield to the main loop."""
+        for _ in range(_POPULATE_CHUNK):
+            if not self._pending_work:
+                break
+            self._pending_work.popleft()()
+        if self._pending_work:
+            return GLib.SOURCE_CONTINUE
+
+        self._work_source_id = None
+        self._saved_expanded = {}
+        self._update_summary()
+        return GLib.SOURCE_REMOVE
 
-        for _, kind, data in top_items:
-            if kind == "group":
-                self._populate_group_result(data, cat_group)
-            else:
-                self._populate_simple_plugin(data, cat_group)
+    def _create_module_row(self, result: dict) -> tuple[Adw.ExpanderRow, Gtk.CheckButton, list[ScanEntryItem]]:
+        """Create a module-level expander row.
 
-    def _create_module_row(self, result: dict) -> tuple[Adw.ExpanderRow, Gtk.CheckButton, list[Gtk.CheckButton]]:
-        """Create a module-level expander row with entry rows inside.
+        Entry selection state lives in ScanEntryItem objects created here;
+        the entry rows showing them are only built when the row is first
+        expanded (or right away if it is restored expanded).
 
         Returns (module_row, module_check, child_checks).
         """
-        total_files = sum(e.get("child_count", 1) for e in result["entries"])
+        total_files = result["total_files"]
         noun = result.get("item_noun", "file")
 
         module_row = Adw.ExpanderRow()
@@ -393,96 +638,120 @@ class ScanResultsView(Gtk.Box):
         module_check = Gtk.CheckButton(active=True, valign=Gtk.Align.CENTER)
         module_row.add_prefix(module_check)
 
-        module_icon = Gtk.Image.new_from_icon_name(result.get("icon", "application-x-executable-symbolic"))
+        module_icon = self._icon_image(result.get("icon", "application-x-executable-symbolic"))
         module_row.add_prefix(module_icon)
 
         # Size label
-        size_label = Gtk.Label(label=bytes_to_human(result["total_bytes"]))
-        size_label.add_css_class("numeric")
-        size_label.add_css_class("dim-label")
+        size_label = Gtk.Label(label=_format_size(result["total_bytes"]), css_classes=["numeric", "dim-label"])
         module_row.add_suffix(size_label)
         self._size_labels.append(size_label)
 
         self._add_clean_status_widgets(module_row, result["plugin_id"])
 
-        # Entry rows inside the expander
-        entries = result["entries"]
-        if self._sort_by_size:
-            entries = sorted(entries, key=lambda e: e["size_bytes"], reverse=True)
+        # Entry items stand in for the entry checkboxes until rows exist
+        child_checks: list[ScanEntryItem] = []
+        items: dict[int, ScanEntryItem] = {}
+        for entry in result["entries"]:
+            item = ScanEntryItem(entry)
+            self._connect_row(item, "notify::active", self._on_entry_item_toggled)
+            child_checks.append(item)
+            items[id(entry)] = item
+            self._selection.add_entry(item, self._entry_info(result, entry))
+        self._module_entries[plugin_id] = (result, items, None)
+
+        if module_row.get_expanded():
+            self._build_entry_rows(plugin_id)
+        else:
+            self._connect_row(module_row, "notify::expanded", self._on_module_expanded, plugin_id)
 
-        child_checks: list[Gtk.CheckButton] = []
-        for entry in entries:
-            entry_path = Path(entry["path"])
-            is_dir = entry.get("is_dir", False)
-            child_count = entry.get("child_count", 1)
+        # Wire module checkbox to toggle all children
+        handler_id = self._connect_row(module_check, "toggled", self._selection.on_module_toggled, child_checks)
+        self._selection.add_module(module_check, result["plugin_id"], child_checks, handler_id)
 
-            row = Adw.ActionRow()
+        return module_row, module_check, child_checks
 
-            icon = "folder-symbolic" if is_dir else "text-x-generic-symbolic"
-            row.set_title(entry_path.name)
-            row.add_prefix(Gtk.Image.new_from_icon_name(icon))
-
-            if is_dir and child_count > 0:
-                row.set_subtitle(f"{child_count:,} file{'s' if child_count != 1 else ''}")
-            elif entry.get("description"):
-                row.set_subtitle(entry["description"])
-
-            # Size label
-            if is_dir and entry["size_bytes"] == 0:
-                size_text = "Empty folder"
-            else:
-                size_text = bytes_to_human(entry["size_bytes"])
-            size_label = Gtk.Label(label=size_text)
-            size_label.add_css_class("numeric")
-            size_label.add_css_class("dim-label")
-            row.add_suffix(size_label)
-
-            # Browse files button for non-empty directories
-            if is_dir and child_count > 0:
-                view_btn = Gtk.Button.new_from_icon_name("view-list-symbolic")
-                view_btn.add_css_class("flat")
-                view_btn.set_valign(Gtk.Align.CENTER)
-                view_btn.set_tooltip_text("Browse files")
-                view_btn.connect("clicked", lambda _, p=entry["path"]: show_file_browser(self.window, p))
-                row.add_suffix(view_btn)
-                self._browse_buttons.append(view_btn)
-
-            # Reveal in File Manager button (skip when Browse files is already shown)
-            if not (is_dir and child_count > 0):
-                fm_btn = Gtk.Button.new_from_icon_name("folder-open-symbolic")
-                fm_btn.add_css_class("flat")
-                fm_btn.set_valign(Gtk.Align.CENTER)
-                fm_btn.set_tooltip_text("Open in File Manager")
-                uri = entry_path.as_uri()
-                fm_btn.connect("clicked", lambda _, u=uri: reveal_in_file_manager(u))
-                row.add_suffix(fm_btn)
-                self._browse_buttons.append(fm_btn)
-
-            # Per-entry checkbox
-            check = Gtk.CheckButton(active=True, valign=Gtk.Align.CENTER)
-            check.connect("toggled", self._selection.on_entry_toggled)
-            row.add_suffix(check)
-            row.set_activatable_widget(check)
-
-            child_checks.append(check)
-            self._selection.add_entry(
-                check,
-                {
-                    "plugin_id": result["plugin_id"],
-                    "plugin_name": result["plugin_name"],
-                    "path": entry["path"],
-                    "size_bytes": entry["size_bytes"],
-                    "requires_root": result.get("requires_root", False),
-                },
-            )
+    def _on_module_expanded(self, module_row: Adw.ExpanderRow, _pspec, plugin_id: str) -> None:
+        if module_row.get_expanded():
+            module_row.disconnect_by_func(self._on_module_expanded)
+            self._build_entry_rows(plugin_id)
+
+    def _build_entry_rows(self, plugin_id: str) -> None:
+        """Add the entry rows (or a ListView for many entries) to a module's expander."""
+        result, items, _ = self._module_entries[plugin_id]
+        module_row = self._expander_rows[plugin_id]
+        entries = result["entries_by_size"] if self._sort_by_size else result["entries"]
+
+        if len(entries) > _LIST_VIEW_THRESHOLD:
+            # Rows are recycled by the ListView
+            store = create_entry_store([items[id(entry)] for entry in entries])
+            module_row.add_row(create_entry_list(self.window, store))
+            self._module_entries[plugin_id] = (result, items, store)
+            return
 
-            module_row.add_row(row)
+        rows: dict[int, Adw.ActionRow] = {}
+        with _frozen(module_row):
+            for entry in entries:
+                row = self._create_entry_row(items[id(entry)])
+                rows[id(entry)] = row
+                module_row.add_row(row)
+        self._module_entries[plugin_id] = (result, rows, module_row)
+
+    def _on_entry_item_toggled(self, item: ScanEntryItem, _pspec) -> None:
+        self._selection.on_entry_toggled(item)
+
+    @staticmethod
+    def _entry_info(result: dict, entry: dict) -> _EntryInfo:
+        """Selection-tracking info for one entry of *result*."""
+        return _EntryInfo(
+            result["plugin_id"],
+            result["plugin_name"],
+            entry["path"],
+            entry["size_bytes"],
+            result.get("requires_root", False),
+        )
 
-        # Wire module checkbox to toggle all children
-        module_check.connect("toggled", self._selection.on_module_toggled, child_checks)
-        self._selection.add_module(module_check, result["plugin_id"], child_checks)
+    def _create_entry_row(self, item: ScanEntryItem) -> Adw.ActionRow:
+        """Create a row showing a single scan entry, bound to its selection item.
 
-        return module_row, module_check, child_checks
+        The checkbox mirrors the item's ``active`` property, and the checkbox
+        and button are hidden along with the item after cleaning.
+        """
+        row = Adw.ActionRow(title=item.title)
+        row.add_prefix(self._icon_image(item.icon_name))
+        if item.subtitle:
+            row.set_subtitle(item.subtitle)
+
+        # Size label
+        size_label = Gtk.Label(label=item.size_text, css_classes=["numeric", "dim-label"])
+        row.add_suffix(size_label)
+
+        # Browse files for non-empty directories, otherwise reveal in File Manager
+        if item.browsable:
+            btn = flat_icon_button("view-list-symbolic", "Browse files")
+            self._connect_row(btn, "clicked", self._on_entry_browse_clicked, item)
+        else:
+            btn = flat_icon_button("folder-open-symbolic", "Open in File Manager")
+            self._connect_row(btn, "clicked", self._on_entry_reveal_clicked, item)
+        row.add_suffix(btn)
+
+        # Per-entry checkbox
+        check = Gtk.CheckButton(valign=Gtk.Align.CENTER)
+        row.add_suffix(check)
+        row.set_activatable_widget(check)
+
+        flags = GObject.BindingFlags.SYNC_CREATE
+        item.bind_property("active", check, "active", flags | GObject.BindingFlags.BIDIRECTIONAL)
+        item.bind_property("selectable", check, "visible", flags)
+        item.bind_property("selectable", btn, "visible", flags)
+
+        return row
+
+    def _on_entry_browse_clicked(self, button: Gtk.Button, item: ScanEntryItem) -> None:
+        show_file_browser(self.window, item.path)
+
+    @staticmethod
+    def _on_entry_reveal_clicked(button: Gtk.Button, item: ScanEntryItem) -> None:
+        reveal_in_file_manager(item.uri)
 
     def _populate_simple_plugin(
         self,
@@ -509,51 +778,25 @@ class ScanResultsView(Gtk.Box):
         All entries are selected/deselected as a unit via one checkbox.
         Returns (member_row, member_check).
         """
-        total_files = sum(e.get("child_count", 1) for e in result["entries"])
+        total_files = result["total_files"]
         noun = result.get("item_noun", "file")
 
         row = Adw.ActionRow()
         row.set_title(result["plugin_name"])
         row.set_subtitle(_format_counts(total_files, noun, result["file_count"]))
-        row.add_prefix(Gtk.Image.new_from_icon_name(result.get("icon", "application-x-executable-symbolic")))
+        row.add_prefix(self._icon_image(result.get("icon", "application-x-executable-symbolic")))
 
         self._add_clean_status_widgets(row, result["plugin_id"])
 
-        entry_paths = [Path(e["path"]) for e in result["entries"]]
-
         # Size label
-        size_label = Gtk.Label(label=bytes_to_human(result["total_bytes"]))
-        size_label.add_css_class("numeric")
-        size_label.add_css_class("dim-label")
+        size_label = Gtk.Label(label=_format_size(result["total_bytes"]), css_classes=["numeric", "dim-label"])
         row.add_suffix(size_label)
         self._size_labels.append(size_label)
 
         # Browse button — shows all entries for this plugin
-        if entry_paths:
-            view_btn = Gtk.Button.new_from_icon_name("view-list-symbolic")
-            view_btn.add_css_class("flat")
-            view_btn.set_valign(Gtk.Align.CENTER)
-            view_btn.set_tooltip_text("Browse files")
-            browse_path = _common_parent(entry_paths)
-
-            if all(e.get("is_leaf", False) for e in result["entries"]):
-                # Leaf entries (e.g. packages) — list them directly
-                leaf_items = [
-                    (str(p.relative_to(browse_path)), e["size_bytes"], e.get("description", ""))
-                    for p, e in zip(entry_paths, result["entries"])
-                ]
-                view_btn.connect(
-                    "clicked",
-                    lambda _, bp=str(browse_path), li=leaf_items, n=noun: show_leaf_browser(self.window, bp, li, n),
-                )
-            else:
-                # Browse only this plugin's directories, not the entire common parent
-                view_btn.connect(
-                    "clicked",
-                    lambda _, d=list(entry_paths), bp=browse_path, t=result["plugin_name"]: show_dirs_browser(
-                        self.window, d, bp, t
-                    ),
-                )
+        if result["entries"]:
+            view_btn = flat_icon_button("view-list-symbolic", "Browse files")
+            self._connect_row(view_btn, "clicked", self._on_member_browse_clicked, result)
             row.add_suffix(view_btn)
             self._browse_buttons.append(view_btn)
 
@@ -562,30 +805,36 @@ class ScanResultsView(Gtk.Box):
         row.add_suffix(member_check)
         row.set_activatable_widget(member_check)
 
-        # Hidden entry checks — all controlled by member_check
-        hidden_checks: list[Gtk.CheckButton] = []
+        # Entry items (never shown) — all controlled by member_check
+        hidden_checks: list[ScanEntryItem] = []
         for entry in result["entries"]:
-            check = Gtk.CheckButton(active=True)
-            check.set_visible(False)
-            hidden_checks.append(check)
-            self._selection.add_entry(
-                check,
-                {
-                    "plugin_id": result["plugin_id"],
-                    "plugin_name": result["plugin_name"],
-                    "path": entry["path"],
-                    "size_bytes": entry["size_bytes"],
-                    "requires_root": result.get("requires_root", False),
-                },
-            )
+            item = ScanEntryItem(entry)
+            hidden_checks.append(item)
+            self._selection.add_entry(item, self._entry_info(result, entry))
 
         # Wire member checkbox to toggle all hidden entry checks
-        member_check.connect("toggled", self._selection.on_module_toggled, hidden_checks)
-        self._selection.add_module(member_check, result["plugin_id"], hidden_checks)
+        handler_id = self._connect_row(member_check, "toggled", self._selection.on_module_toggled, hidden_checks)
+        self._selection.add_module(member_check, result["plugin_id"], hidden_checks, handler_id)
 
         self._plugin_rows[result["plugin_id"]] = row
         return row, member_check
 
+    def _on_member_browse_clicked(self, button: Gtk.Button, result: dict) -> None:
+        """Browse all entries of a grouped plugin, relative to their common parent."""
+        browse_path = Path(result["common_parent"])
+        entries = result["entries"]
+        if all(e.get("is_leaf", False) for e in entries):
+            # Leaf entries (e.g. packages) — list them directly
+            leaf_items = [
+                (str(Path(e["path"]).relative_to(browse_path)), e["size_bytes"], e.get("description", ""))
+                for e in entries
+            ]
+            show_leaf_browser(self.window, str(browse_path), leaf_items, result.get("item_noun", "file"))
+        else:
+            # Browse only this plugin's directories, not the entire common parent
+            dirs = [Path(e["path"]) for e in entries]
+            show_dirs_browser(self.window, dirs, browse_path, result["plugin_name"])
+
     def _populate_group_result(
         self,
         member_results: list[dict],
@@ -602,7 +851,7 @@ class ScanResultsView(Gtk.Box):
 
         # Compute group totals
         group_total_bytes = sum(r["total_bytes"] for r in member_results)
-        group_total_files = sum(sum(e.get("child_count", 1) for e in r["entries"]) for r in member_results)
+        group_total_files = sum(r["total_files"] for r in member_results)
         group_entry_count = sum(r["file_count"] for r in member_results)
 
         if cat_group is None:
@@ -621,12 +870,10 @@ class ScanResultsView(Gtk.Box):
 
         group_check = Gtk.CheckButton(active=True, valign=Gtk.Align.CENTER)
         group_row.add_prefix(group_check)
-        group_row.add_prefix(Gtk.Image.new_from_icon_name(group_icon))
+        group_row.add_prefix(self._icon_image(group_icon))
 
         # Size label
-        size_label = Gtk.Label(label=bytes_to_human(group_total_bytes))
-        size_label.add_css_class("numeric")
-        size_label.add_css_class("dim-label")
+        size_label = Gtk.Label(label=_format_size(group_total_bytes), css_classes=["numeric", "dim-label"])
         group_row.add_suffix(size_label)
         self._size_labels.append(size_label)
 
@@ -635,16 +882,20 @@ class ScanResultsView(Gtk.Box):
 
         # Create flat member rows inside the group expander
         member_module_checks: list[Gtk.CheckButton] = []
+        member_rows: list[tuple[int, int, str, Gtk.Widget]] = []
         for result in member_results:
             member_row, member_check = self._create_group_member_row(result)
             group_row.add_row(member_row)
             member_module_checks.append(member_check)
+            member_rows.append((result["total_bytes"], result.get("sort_order", 50), result["sort_name"], member_row))
 
+        self._group_member_rows[group_id] = member_rows
         self._group_plugin_ids[group_id] = [r["plugin_id"] for r in member_results]
+        self._clean.register_group_members(group_id, member_results)
 
         # Wire group checkbox → all member module checks
-        group_check.connect("toggled", self._selection.on_group_toggled, member_module_checks)
-        self._selection.add_group(group_check, member_module_checks)
+        handler_id = self._connect_row(group_check, "toggled", self._selection.on_group_toggled, member_module_checks)
+        self._selection.add_group(group_check, member_module_checks, handler_id)
 
     def _populate_empty_plugins(self, empty_results: list[dict]) -> None:
         """Show plugins that were scanned but found nothing."""
@@ -659,12 +910,10 @@ class ScanResultsView(Gtk.Box):
         for result in empty_results:
             row = Adw.ActionRow()
             row.set_title(result["plugin_name"])
-            row.add_prefix(Gtk.Image.new_from_icon_name(result.get("icon", "application-x-executable-symbolic")))
+            row.add_prefix(self._icon_image(result.get("icon", "application-x-executable-symbolic")))
             row.add_css_class("dim-label")
 
-            badge = Gtk.Label(label="Empty")
-            badge.add_css_class("dim-label")
-            badge.add_css_class("caption")
+            badge = Gtk.Label(label="Empty", css_classes=["dim-label", "caption"])
             row.add_suffix(badge)
 
             group.add(row)
@@ -682,11 +931,9 @@ class ScanResultsView(Gtk.Box):
             row = Adw.ActionRow()
             row.set_title(result["plugin_name"])
             row.set_subtitle(result.get("error", "Unknown error"))
-            row.add_prefix(Gtk.Image.new_from_icon_name("dialog-warning-symbolic"))
+            row.add_prefix(self._icon_image("dialog-warning-symbolic"))
 
-            badge = Gtk.Label(label="Error")
-            badge.add_css_class("warning")
-            badge.add_css_class("caption")
+            badge = Gtk.Label(label="Error", css_classes=["warning", "caption"])
             row.add_suffix(badge)
 
             group.add(row)
@@ -710,7 +957,14 @@ class ScanResultsView(Gtk.Box):
         self._show_empty_results = show_empty
         self._scan_start_time = time.monotonic()
         # Clear all existing state
+        self._cancel_pending_work()
+        self._cancel_stream_flush()
+        self._disconnect_rows()
         self._scan_results.clear()
+        self._partition = None
+        self._total_bytes = 0
+        self._module_count = 0
+        self._error_count = 0
         self._selection.clear()
         self._clean.clear()
         for group in self._groups:
@@ -719,11 +973,15 @@ class ScanResultsView(Gtk.Box):
 
         self._group_pending.clear()
         self._group_expected = dict(group_info)
+        self._group_totals.clear()
         self._group_widgets.clear()
         self._empty_results.clear()
         self._expander_rows.clear()
         self._category_groups.clear()
+        self._group_ranks.clear()
         self._category_children.clear()
+        self._group_member_rows.clear()
+        self._module_entries.clear()
         self._browse_buttons.clear()
         self._size_labels.clear()
         self._plugin_rows.clear()
@@ -748,30 +1006,68 @@ class ScanResultsView(Gtk.Box):
         self.action_bar.set_visible(False)
         self._toolbar_revealer.set_reveal_child(False)
 
-    def add_streaming_result(self, result: dict, generation: int) -> None:
-        """Add a single scan result during streaming. Called via GLib.idle_add.
+    def post_streaming_result(self, result: dict, generation: int) -> None:
+        """Queue a scan result from a scan thread.
+
+        Thread-safe.  Only the first result posted since the main loop last
+        drained the queue schedules an idle callback, so a chatty scan does
+        not wake the main loop once per result.
 
         Args:
             result: Transformed scan result dict.
-            generation: Scan generation to detect stale callbacks.
+            generation: Scan generation the result belongs to.
         """
-        if generation != self._scan_generation:
-            return
+        self._posted.put((result, generation))
+
+    def _on_posted_results(self, posted: list[tuple[dict, int]]) -> None:
+        """Add a batch of results posted by scan threads, skipping those of earlier scans."""
+        generation = self._scan_generation
+        batch = [result for result, result_generation in posted if result_generation == generation]
+        if batch:
+            self._flush_streaming_results(batch)
+
+    def _cancel_stream_flush(self) -> None:
+        """Drop streaming results posted but not yet added."""
+        self._posted.clear()
+
+    def _flush_streaming_results(self, batch: list[dict]) -> None:
+        """Add a batch of streaming results, then update progress and the action bar once.
+
+        A burst of fast plugins costs one progress update and one category
+        re-sort instead of one per result.
+        """
+        with _frozen(self.prefs_page):
+            rendered = [self._add_streaming_result_rows(result) for result in batch]
 
-        self._scan_completed += 1
-        self._scan_results.append(result)
         self._progress_banner.set_title(f"Scanning {self._scan_completed}/{self._scan_total} modules\u2026")
         if self._scan_total > 0:
             self._progress_bar.set_fraction(self._scan_completed / self._scan_total)
 
+        # Show action bar and toolbar once we have actionable results
+        if any(rendered) and self._selection.has_modules:
+            self.action_bar.set_visible(True)
+            self._toolbar_revealer.set_reveal_child(True)
+            self._update_summary()
+
+    def _add_streaming_result_rows(self, result: dict) -> bool:
+        """Record one streamed result and add its rows. Returns False if nothing was rendered."""
+        self._scan_completed += 1
+        self._scan_results.append(result)
+        self._partition = None
+
         group = result.get("group")
         has_error = bool(result.get("error"))
         is_empty = result["total_bytes"] == 0
+        self._total_bytes += result["total_bytes"]
+        self._module_count += not is_empty
+        self._error_count += has_error
 
         if is_empty and not has_error:
             self._empty_results.append(result)
 
         cat_id = result.get("category", "user")
+        if not is_empty:
+            self._plugin_to_cat[result["plugin_id"]] = cat_id
 
         if group:
             # Always track group membership (even empty results count toward
@@ -780,27 +1076,18 @@ class ScanResultsView(Gtk.Box):
         elif not is_empty:
             cat_group = self._get_or_create_category_group(cat_id)
             self._populate_simple_plugin(result, cat_group)
-            # Track metadata for sorted insertion within category
-            self._category_children.setdefault(cat_id, []).append(
+            self._insert_category_child(
+                cat_id,
                 (
                     result["total_bytes"],
                     result.get("sort_order", 50),
-                    result["plugin_name"].lower(),
+                    result["sort_name"],
                     self._expander_rows[result["plugin_id"]],
-                )
+                ),
             )
-            self._sort_category_items(cat_id)
         else:
-            return  # standalone empty result — nothing to render yet
-
-        # Re-sort categories on the page
-        self._resort_groups()
-
-        # Show action bar and toolbar once we have actionable results
-        if self._selection.has_modules:
-            self.action_bar.set_visible(True)
-            self._toolbar_revealer.set_reveal_child(True)
-            self._update_summary()
+            return False  # standalone empty result — nothing to render yet
+        return True
 
     def _add_streaming_group_result(
         self,
@@ -810,14 +1097,17 @@ class ScanResultsView(Gtk.Box):
     ) -> None:
         """Handle a streaming result that belongs to a plugin group."""
         group_id = group["id"]
-        self._group_pending.setdefault(group_id, []).append(result)
+        self._group_pending[group_id].append(result)
         pending = self._group_pending[group_id]
         expected = self._group_expected.get(group_id, 1)
+        totals = self._group_totals[group_id]
+        if result["total_bytes"] > 0:
+            totals.add(result)
 
         # Only non-empty members produce UI rows
         actionable = [r for r in pending if r["total_bytes"] > 0]
 
-        self._teardown_streaming_group(group_id, cat_id, actionable, result)
+        self._teardown_streaming_group(group_id, actionable, result)
 
         if not actionable:
             return
@@ -825,50 +1115,37 @@ class ScanResultsView(Gtk.Box):
         cat_group = self._get_or_create_category_group(cat_id)
         remaining = expected - len(pending)
         if self._sort_by_size:
-            actionable.sort(key=lambda r: r["total_bytes"], reverse=True)
+            actionable.sort(key=itemgetter("total_bytes"), reverse=True)
         else:
-            actionable.sort(key=lambda r: (r.get("sort_order", 50), r["plugin_name"].lower()))
+            actionable.sort(key=_order_key)
 
         if remaining <= 0:
             self._populate_group_result(actionable, cat_group)
-            self._group_widgets[group_id] = (cat_group, self._expander_rows[group["id"]])
+            group_row = self._expander_rows[group_id]
         else:
-            self._build_partial_group(actionable, group, remaining, cat_group)
-
-        # Track metadata for sorted insertion within category
-        group_total = sum(r["total_bytes"] for r in actionable)
-        best = actionable[0]
-        group_widget = self._group_widgets[group_id][1]
-        self._category_children.setdefault(cat_id, []).append(
-            (
-                group_total,
-                best.get("sort_order", 50),
-                best["plugin_name"].lower(),
-                group_widget,
-            )
-        )
-        self._sort_category_items(cat_id)
+            group_row = self._build_partial_group(actionable, group, remaining, cat_group, totals)
+
+        # Same position as populate() gives the group: its first member by sort order
+        first = min(actionable, key=_order_key)
+        child = (totals.bytes, first.get("sort_order", 50), first["sort_name"], group_row)
+        self._group_widgets[group_id] = (cat_id, child)
+        self._insert_category_child(cat_id, child)
 
     def _teardown_streaming_group(
         self,
         group_id: str,
-        cat_id: str,
         actionable: list[dict],
         new_result: dict,
     ) -> None:
         """Remove old group widget and clean up stale selection/clean state."""
-        old_entry = self._group_widgets.pop(group_id, None)
-        if not old_entry:
+        inserted = self._group_widgets.pop(group_id, None)
+        if not inserted:
             return
 
-        old_cat_group, old_expander = old_entry
-        old_cat_group.remove(old_expander)
-
-        # Remove from category children tracking
-        if cat_id in self._category_children:
-            self._category_children[cat_id] = [
-                item for item in self._category_children[cat_id] if item[3] is not old_expander
-            ]
+        cat_id, old_child = inserted
+        self._category_groups[cat_id].remove(old_child[3])
+        self._group_member_rows.pop(group_id, None)
+        self._remove_category_child(cat_id, old_child)
 
         # Clean up checks for previously rendered (non-empty) members
         previously_rendered = {r["plugin_id"] for r in actionable}
@@ -883,7 +1160,8 @@ class ScanResultsView(Gtk.Box):
         group_meta: dict,
         remaining: int,
         cat_group: Adw.PreferencesGroup,
-    ) -> None:
+        totals: _GroupTotals,
+    ) -> Adw.ExpanderRow:
         """Build a temporary group widget with partial results and a loading row.
 
         Args:
@@ -891,31 +1169,27 @@ class ScanResultsView(Gtk.Box):
             group_meta: Group metadata (id, name).
             remaining: Number of members still being scanned.
             cat_group: Category group to add the expander to.
+            totals: Running totals of *member_results*.
+
+        Returns:
+            The group's expander row.
         """
-        group_id = group_meta["id"]
         group_icon = member_results[0].get("icon", "application-x-executable-symbolic")
 
-        group_total_bytes = sum(r["total_bytes"] for r in member_results)
-        group_total_files = sum(sum(e.get("child_count", 1) for e in r["entries"]) for r in member_results)
-        group_entry_count = sum(r["file_count"] for r in member_results)
-
         group_row = Adw.ExpanderRow()
         group_row.set_title(group_meta["name"])
-        group_row.set_subtitle(_format_counts(group_total_files, "file", group_entry_count))
+        group_row.set_subtitle(_format_counts(totals.files, "file", totals.entries))
 
         group_check = Gtk.CheckButton(active=True, valign=Gtk.Align.CENTER)
         group_row.add_prefix(group_check)
-        group_row.add_prefix(Gtk.Image.new_from_icon_name(group_icon))
+        group_row.add_prefix(self._icon_image(group_icon))
 
         # Size label
-        size_label = Gtk.Label(label=bytes_to_human(group_total_bytes))
-        size_label.add_css_class("numeric")
-        size_label.add_css_class("dim-label")
+        size_label = Gtk.Label(label=_format_size(totals.bytes), css_classes=["numeric", "dim-label"])
         group_row.add_suffix(size_label)
         self._size_labels.append(size_label)
 
         cat_group.add(group_row)
-        self._group_widgets[group_id] = (cat_group, group_row)
 
         member_module_checks: list[Gtk.CheckButton] = []
         for result in member_results:
@@ -937,28 +1211,42 @@ class ScanResultsView(Gtk.Box):
         loading_row.add_prefix(loading_box)
         group_row.add_row(loading_row)
 
-        group_check.connect("toggled", self._selection.on_group_toggled, member_module_checks)
-        self._selection.add_group(group_check, member_module_checks)
+        handler_id = self._connect_row(group_check, "toggled", self._selection.on_group_toggled, member_module_checks)
+        self._selection.add_group(group_check, member_module_checks, handler_id)
+        return group_row
 
-    def _resort_groups(self) -> None:
-        """Re-sort category groups on the page to match CATEGORY_LABELS order."""
-        if len(self._groups) <= 1:
-            return
+    @property
+    def _child_key(self) -> Callable[[tuple[int, int, str, Gtk.Widget]], tuple]:
+        """Display sort key function for _category_children entries in the current mode."""
+        return _child_size_key if self._sort_by_size else _child_order_key
 
-        # Build sort key: category order from CATEGORY_LABELS, unknown categories last
-        cat_order = {cat_id: i for i, cat_id in enumerate(CATEGORY_LABELS)}
+    def _insert_category_child(self, cat_id: str, child: tuple[int, int, str, Gtk.Widget]) -> None:
+        """Insert a freshly added widget at its sorted position within a category.
 
-        def _sort_key(g: Adw.PreferencesGroup) -> int:
-            for cat_id, cat_group in self._category_groups.items():
-                if cat_group is g:
-                    return cat_order.get(cat_id, len(cat_order))
-            return len(cat_order) + 1  # unknown groups at end
+        The widget has just been appended to the category group, so only the
+        rows that sort after it need to be moved behind it.
+        """
+        children = self._category_children[cat_id]
+        key = self._child_key
+        index = bisect.bisect_right(children, key(child), key=key)
+        children.insert(index, child)
 
-        for g in self._groups:
-            self.prefs_page.remove(g)
-        self._groups.sort(key=_sort_key)
-        for g in self._groups:
-            self.prefs_page.add(g)
+        cat_group = self._category_groups[cat_id]
+        with _frozen(cat_group):
+            for _, _, _, widget in children[index + 1 :]:
+                cat_group.remove(widget)
+                cat_group.add(widget)
+
+    def _remove_category_child(self, cat_id: str, child: tuple[int, int, str, Gtk.Widget]) -> None:
+        """Drop *child* from a category's sorted children, locating it by its sort key."""
+        children = self._category_children[cat_id]
+        key = self._child_key
+        for i in range(bisect.bisect_left(children, key(child), key=key), len(children)):
+            if children[i] is child:
+                del children[i]
+                return
+        # Not at its key's position; fall back to a linear search
+        children[:] = [existing for existing in children if existing is not child]
 
     def _sort_category_items(self, cat_id: str) -> None:
         """Re-sort items within a category group to maintain correct display order.
@@ -968,37 +1256,76 @@ class ScanResultsView(Gtk.Box):
         children = self._category_children.get(cat_id)
         if not children or len(children) <= 1:
             return
+        ordered = sorted(children, key=self._child_key)
+        start = _unchanged_prefix(children, ordered)
+        if start == len(children):
+            return
+
+        # Rows before the first one that moves keep their place
         cat_group = self._category_groups[cat_id]
-        for _, _, _, widget in children:
-            cat_group.remove(widget)
-        if self._sort_by_size:
-            children.sort(key=lambda x: (-x[0], x[2]))
-        else:
-            children.sort(key=lambda x: (x[1], x[2]))
-        for _, _, _, widget in children:
-            cat_group.add(widget)
+        with _frozen(cat_group):
+            for _, _, _, widget in children[start:]:
+                cat_group.remove(widget)
+            for _, _, _, widget in ordered[start:]:
+                cat_group.add(widget)
+        children[:] = ordered
+
+    def _sort_module_entries(self, plugin_id: str) -> None:
+        """Re-order a module's entry rows (or ListView items) for the current sort mode."""
+        result, children, container = self._module_entries[plugin_id]
+        if container is None or len(children) <= 1:
+            return
+        entries = result["entries_by_size"] if self._sort_by_size else result["entries"]
+        ordered = [children[id(entry)] for entry in entries]
+        if isinstance(container, Gio.ListStore):
+            container.splice(0, container.get_n_items(), ordered)
+            return
+        with _frozen(container):
+            for row in ordered:
+                container.remove(row)
+            for row in ordered:
+                container.add_row(row)
+
+    def _sort_group_members(self, group_id: str) -> None:
+        """Re-sort the member rows inside a completed group expander."""
+        members = self._group_member_rows.get(group_id)
+        if not members or len(members) <= 1:
+            return
+        ordered = sorted(members, key=self._child_key)
+        start = _unchanged_prefix(members, ordered)
+        if start == len(members):
+            return
+
+        group_row = self._expander_rows[group_id]
+        with _frozen(group_row):
+            for _, _, _, row in members[start:]:
+                group_row.remove(row)
+            for _, _, _, row in ordered[start:]:
+                group_row.add_row(row)
+        members[:] = ordered
 
     def finish_streaming_scan(self) -> float:
-        """Finalize the streaming scan — show summary banner, rebuild with correct ordering.
+        """Finalize the streaming scan — show summary banner and the remaining sections.
 
         Returns:
             Elapsed scan time in seconds.
         """
         elapsed = time.monotonic() - self._scan_start_time
+        self._posted.drain()
         self._scanning = False
 
         # Stop progress indicators, keep banner visible with summary
         self._progress_spinner.set_spinning(False)
         self._progress_bar_row.set_visible(False)
 
-        total = sum(r["total_bytes"] for r in self._scan_results)
-        module_count = sum(1 for r in self._scan_results if r["total_bytes"] > 0)
-        error_count = sum(1 for r in self._scan_results if r.get("error"))
+        total = self._total_bytes
+        module_count = self._module_count
+        error_count = self._error_count
         time_str = _format_elapsed(elapsed)
 
         if total > 0:
             banner_text = (
-                f"Found {bytes_to_human(total)} in {module_count} "
+                f"Found {_format_size(total)} in {module_count} "
                 f"{'module' if module_count == 1 else 'modules'} "
                 f"\u00b7 Scanned in {time_str}"
             )
@@ -1010,9 +1337,21 @@ class ScanResultsView(Gtk.Box):
 
         self._progress_banner.set_title(banner_text)
 
-        # Rebuild the view via populate() so items within each category are
-        # properly sorted (streaming adds them in arrival order).
-        self.populate(self._scan_results)
+        # Streamed rows are already in display order; only the empty and
+        # errored sections are left to add.  A group still missing members
+        # (or a scan with nothing actionable) is rebuilt via populate().
+        partial_groups = self._group_widgets.keys() - self._group_member_rows.keys()
+        if partial_groups or not self._category_groups:
+            self.populate(self._scan_results)
+            return elapsed
+
+        errored = [r for r in self._scan_results if r.get("error")]
+        with _frozen(self.prefs_page):
+            if self._empty_results and self._show_empty_results:
+                self._populate_empty_plugins(self._empty_results)
+            if errored:
+                self._populate_errored_plugins(errored)
+        self._update_summary()
         return elapsed
 
     def _update_summary(self) -> None:
@@ -1023,10 +1362,11 @@ class ScanResultsView(Gtk.Box):
             self.clean_btn.set_sensitive(False)
             return
 
-        self.clean_btn.set_sensitive(True)
+        # Entries still being built are not selectable yet — wait for them
+        self.clean_btn.set_sensitive(not self._pending_work)
         total_items = info["total_items"]
         parts = [
-            bytes_to_human(info["total_size"]),
+            _format_size(info["total_size"]),
             f"{total_items:,} item{'s' if total_items != 1 else ''}",
         ]
         module_names = [m["name"] for m in info["modules"]]
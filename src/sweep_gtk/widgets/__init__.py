@@ -1,6 +1,6 @@
 """Shared GTK widgets and helpers."""
 
-from sweep_gtk.widgets.common import icon_label
+from sweep_gtk.widgets.common import flat_icon_button, icon_label
 from sweep_gtk.widgets.file_browser_popup import (
     reveal_in_file_manager,
     show_dirs_browser,
@@ -9,6 +9,7 @@ from sweep_gtk.widgets.file_browser_popup import (
 )
 
 __all__ = [
+    "flat_icon_button",
     "icon_label",
     "reveal_in_file_manager",
     "show_dirs_browser",
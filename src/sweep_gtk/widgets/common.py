@@ -15,3 +15,10 @@ def icon_label(icon_name: str, label: str) -> Gtk.Box:
     box.append(Gtk.Image.new_from_icon_name(icon_name))
     box.append(Gtk.Label(label=label))
     return box
+
+
+def flat_icon_button(icon_name: str, tooltip: str) -> Gtk.Button:
+    """Create a flat, vertically centered icon button for row suffixes."""
+    btn = Gtk.Button(icon_name=icon_name, valign=Gtk.Align.CENTER, tooltip_text=tooltip)
+    btn.add_css_class("flat")
+    return btn
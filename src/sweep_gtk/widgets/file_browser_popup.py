@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import os
 import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterator
+from urllib.parse import quote_from_bytes
 from pathlib import Path
 
 import gi
@@ -10,9 +18,49 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gio, Gtk, GLib, Pango
+from gi.repository import Adw, Gdk, Gio, GObject, Gtk, GLib, Pango
 
 from sweep.utils import bytes_to_human
+from sweep_gtk.widgets.common import flat_icon_button
+
+# Many listed files share a size (empty files, whole blocks)
+_format_size = lru_cache(maxsize=4096)(bytes_to_human)
+
+# Enumerated entries are handed to the popup in batches of this many,
+# or sooner once this long (seconds) has passed since the last batch
+_BATCH_SIZE = 1000
+_BATCH_INTERVAL = 0.1
+
+# Threads walking top-level subdirectories in parallel
+_MAX_WALKERS = 8
+
+# Row icons for tree listings, indexed by is_dir, and for leaf listings
+_ICONS = ("text-x-generic-symbolic", "folder-symbolic")
+_LEAF_ICON = "system-software-install-symbolic"
+
+
+class _FileRow(GObject.Object):
+    """Display data for one row of the file browser list.
+
+    *rel_path* is a GObject property so the list can be sorted by it in C.
+    Display strings are derived when a row is bound, so only rows that are
+    actually scrolled into view pay for formatting.  *base_uri* is shared
+    by all rows of a listing; rows without one have no file manager button.
+    """
+
+    __gtype_name__ = "SweepFileRow"
+
+    rel_path = GObject.Property(type=str)
+
+    def __init__(
+        self, rel_path: str, size: int, is_dir: bool, icon_name: str, desc: str = "", base_uri: str = ""
+    ) -> None:
+        super().__init__(rel_path=rel_path)
+        self.size = size
+        self.is_dir = is_dir
+        self.icon_name = icon_name
+        self.desc = desc
+        self.base_uri = base_uri
 
 
 def reveal_in_file_manager(uri: str) -> None:
@@ -42,66 +90,184 @@ def reveal_in_file_manager(uri: str) -> None:
         Gtk.show_uri(None, target.as_uri(), 0)
 
 
+def _scan_dir(dir_path: str, prefix: str) -> tuple[list[tuple[str, int, bool]], list[tuple[str, str]]]:
+    """List one directory for the file browser.
+
+    Returns its ``(rel_path, size, is_dir)`` entries, with *prefix*
+    prepended to each name, and the ``(path, prefix)`` pairs of its
+    subdirectories.  Symlinks are skipped, not followed; an unreadable
+    directory lists as empty.  Uses ``os.scandir`` so the type checks
+    come from the directory listing and only regular files need a ``stat``.
+    """
+    entries: list[tuple[str, int, bool]] = []
+    subdirs: list[tuple[str, str]] = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    # With follow_symlinks=False a symlink is neither a
+                    # directory nor a regular file, so both checks skip it
+                    if entry.is_dir(follow_symlinks=False):
+                        rel_path = prefix + entry.name
+                        subdirs.append((entry.path, rel_path + "/"))
+                        entries.append((rel_path, 0, True))
+                    elif entry.is_file(follow_symlinks=False):
+                        rel_path = prefix + entry.name
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            size = 0
+                        entries.append((rel_path, size, False))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return entries, subdirs
+
+
+def _walk_tree(root: str, prefix: str = "") -> Iterator[tuple[str, int, bool]]:
+    """Yield ``(rel_path, size, is_dir)`` for every file and directory below *root*.
+
+    Paths are relative to *root* with *prefix* prepended; see _scan_dir().
+    """
+    stack = [(root, prefix)]
+    while stack:
+        entries, subdirs = _scan_dir(*stack.pop())
+        yield from entries
+        stack.extend(subdirs)
+
+
+class _BrowserPopup(Adw.Window):
+    """File browser popup window: a header with an *Open in File Manager* button.
+
+    Closed popups are hidden and kept in a small pool instead of being
+    destroyed, so opening the next one only swaps its titles and content.
+    Closing a popup cancels its listing, stopping any enumeration feeding it.
+    """
+
+    def __init__(self, parent_window: Gtk.Window) -> None:
+        super().__init__(default_width=650, default_height=500, modal=True, hide_on_close=True)
+        self.set_transient_for(parent_window)
+        self._uri = ""
+        self.listing: _FileListing | None = None
+
+        self.toolbar_view = Adw.ToolbarView()
+        self.set_content(self.toolbar_view)
+
+        header = Adw.HeaderBar()
+        self._title = Adw.WindowTitle()
+        header.set_title_widget(self._title)
+
+        open_btn = Gtk.Button.new_from_icon_name("folder-open-symbolic")
+        open_btn.add_css_class("flat")
+        open_btn.set_tooltip_text("Open in File Manager")
+        open_btn.connect("clicked", self._on_open_clicked)
+        header.pack_end(open_btn)
+
+        self.toolbar_view.add_top_bar(header)
+        self.connect("close-request", self._on_close_request)
+
+    def show_folder(self, title: str, subtitle: str, folder_path: Path) -> None:
+        """Set the titles and the folder opened by the header button."""
+        self._title.set_title(title)
+        self._title.set_subtitle(subtitle)
+        self._uri = folder_path.as_uri()
+
+    def _on_open_clicked(self, _btn: Gtk.Button) -> None:
+        Gtk.show_uri(self, self._uri, 0)
+
+    def _on_close_request(self, _window: Adw.Window) -> bool:
+        if self.listing is not None:
+            self.listing.cancel()
+            self.listing = None
+        self.toolbar_view.set_content(None)
+
+        # Keep a few closed popups for reuse; destroy the rest
+        pool = _popup_pools.setdefault(self.get_transient_for(), [])
+        if len(pool) < _POPUP_POOL_SIZE:
+            pool.append(self)
+        else:
+            self.set_hide_on_close(False)
+        return False
+
+
+# Closed popups waiting to be reused by _create_popup(), per parent window;
+# a pool goes away with its parent
+_POPUP_POOL_SIZE = 2
+_popup_pools: weakref.WeakKeyDictionary[Gtk.Window, list[_BrowserPopup]] = weakref.WeakKeyDictionary()
+
+
 def _create_popup(
     parent_window: Gtk.Window,
     title: str,
     subtitle: str,
     folder_path: Path,
 ) -> tuple[Adw.Window, Adw.ToolbarView]:
-    """Create a standard file browser popup with header and Open in File Manager button."""
-    popup = Adw.Window()
-    popup.set_default_size(650, 500)
-    popup.set_modal(True)
-    popup.set_transient_for(parent_window)
+    """Get a file browser popup for *folder_path*, reusing a closed one if possible."""
+    pool = _popup_pools.get(parent_window)
+    popup = pool.pop() if pool else _BrowserPopup(parent_window)
+    popup.show_folder(title, subtitle, folder_path)
+    return popup, popup.toolbar_view
+
+
+def _enumerate_into_popup(
+    popup: Adw.Window,
+    toolbar_view: Adw.ToolbarView,
+    roots: list[tuple[Path, str]],
+    base_path: Path,
+) -> None:
+    """Present *popup* and list *roots* in it while they are being enumerated.
 
-    toolbar_view = Adw.ToolbarView()
-    popup.set_content(toolbar_view)
+    Each root is a ``(directory, prefix)`` pair as taken by _walk_tree().
+    The top-level subdirectories are walked in parallel by a small thread
+    pool, overlapping their directory reads (os.scandir releases the GIL),
+    and entries reach the listing in batches, so the first rows show up
+    long before a large tree is fully walked.
+    """
+    listing = popup.listing = _FileListing(toolbar_view, base_path=base_path)
+    cancelled = listing.cancelled
+    popup.present()
 
-    header = Adw.HeaderBar()
-    header.set_title_widget(Adw.WindowTitle(title=title, subtitle=subtitle))
+    def walk(subdir: tuple[str, str]) -> None:
+        batch: list[tuple[str, int, bool]] = []
+        next_send = time.monotonic() + _BATCH_INTERVAL
+        for entry in _walk_tree(*subdir):
+            batch.append(entry)
+            if len(batch) >= _BATCH_SIZE or time.monotonic() >= next_send:
+                if cancelled.is_set():
+                    return
+                GLib.idle_add(listing.add, batch)
+                batch = []
+                next_send = time.monotonic() + _BATCH_INTERVAL
+        if batch:
+            GLib.idle_add(listing.add, batch)
 
-    open_btn = Gtk.Button.new_from_icon_name("folder-open-symbolic")
-    open_btn.add_css_class("flat")
-    open_btn.set_tooltip_text("Open in File Manager")
-    uri = folder_path.as_uri()
-    open_btn.connect("clicked", lambda _, u=uri: Gtk.show_uri(popup, u, 0))
-    header.pack_end(open_btn)
+    def enumerate_files():
+        top_level: list[tuple[str, int, bool]] = []
+        subdirs: list[tuple[str, str]] = []
+        for root, prefix in roots:
+            root_entries, root_subdirs = _scan_dir(str(root), prefix)
+            top_level.extend(root_entries)
+            subdirs.extend(root_subdirs)
+        if cancelled.is_set():
+            return
+        GLib.idle_add(listing.add, top_level)
+
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=min(_MAX_WALKERS, len(subdirs))) as pool:
+                for _ in pool.map(walk, subdirs):
+                    pass
 
-    toolbar_view.add_top_bar(header)
-    return popup, toolbar_view
+        GLib.idle_add(listing.finish)
+
+    threading.Thread(target=enumerate_files, daemon=True).start()
 
 
 def show_file_browser(parent_window: Gtk.Window, path_str: str) -> None:
     """Open a popup window listing all files and directories."""
     path = Path(path_str)
     popup, toolbar_view = _create_popup(parent_window, path.name, str(path), path)
-
-    spinner = Gtk.Spinner(spinning=True, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
-    toolbar_view.set_content(spinner)
-    popup.present()
-
-    def enumerate_files():
-        entries: list[tuple[str, int, bool]] = []
-        try:
-            for item in path.rglob("*"):
-                try:
-                    if not item.is_symlink():
-                        is_file = item.is_file()
-                        is_dir = item.is_dir()
-                        if is_file or is_dir:
-                            try:
-                                size = item.lstat().st_size if is_file else 0
-                            except OSError:
-                                size = 0
-                            entries.append((str(item.relative_to(path)), size, is_dir))
-                except OSError:
-                    pass
-        except OSError:
-            pass
-        entries.sort(key=lambda x: x[0])
-        GLib.idle_add(lambda: _populate_file_popup(popup, toolbar_view, entries, base_path=path))
-
-    threading.Thread(target=enumerate_files, daemon=True).start()
+    _enumerate_into_popup(popup, toolbar_view, [(path, "")], path)
 
 
 def show_dirs_browser(
@@ -123,36 +289,11 @@ def show_dirs_browser(
         title: Popup title (e.g. plugin name).
     """
     popup, toolbar_view = _create_popup(parent_window, title, str(base_path), base_path)
-
-    spinner = Gtk.Spinner(spinning=True, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
-    toolbar_view.set_content(spinner)
-    popup.present()
-
-    def enumerate_files():
-        entries: list[tuple[str, int, bool]] = []
-        for d in dirs:
-            if not d.is_dir():
-                continue
-            try:
-                for item in d.rglob("*"):
-                    try:
-                        if not item.is_symlink():
-                            is_file = item.is_file()
-                            is_dir = item.is_dir()
-                            if is_file or is_dir:
-                                try:
-                                    size = item.lstat().st_size if is_file else 0
-                                except OSError:
-                                    size = 0
-                                entries.append((str(item.relative_to(base_path)), size, is_dir))
-                    except OSError:
-                        pass
-            except OSError:
-                pass
-        entries.sort(key=lambda x: x[0])
-        GLib.idle_add(lambda: _populate_file_popup(popup, toolbar_view, entries, base_path=base_path))
-
-    threading.Thread(target=enumerate_files, daemon=True).start()
+    roots: list[tuple[Path, str]] = []
+    for d in dirs:
+        rel_dir = str(d.relative_to(base_path))
+        roots.append((d, "" if rel_dir == "." else rel_dir + "/"))
+    _enumerate_into_popup(popup, toolbar_view, roots, base_path)
 
 
 def show_leaf_browser(
@@ -165,103 +306,163 @@ def show_leaf_browser(
     path = Path(path_str)
     popup, toolbar_view = _create_popup(parent_window, path.name, str(path), path)
 
-    _populate_file_popup(popup, toolbar_view, items, noun=noun)
+    listing = popup.listing = _FileListing(toolbar_view, noun=noun)
     popup.present()
 
+    # Add the rows in batches from idle callbacks so the popup paints in between
+    starts = iter(range(0, len(items), _BATCH_SIZE))
 
-def _populate_file_popup(
-    popup: Adw.Window,
-    toolbar_view: Adw.ToolbarView,
-    files: list[tuple[str, int]] | list[tuple[str, int, str]] | list[tuple[str, int, bool]],
-    *,
-    noun: str = "file",
-    base_path: Path | None = None,
-) -> None:
-    """Fill the file browser popup with enumerated files.
+    def add_batch() -> bool:
+        if listing.cancelled.is_set():
+            return GLib.SOURCE_REMOVE
+        start = next(starts, None)
+        if start is None:
+            listing.finish()
+            return GLib.SOURCE_REMOVE
+        listing.add(items[start : start + _BATCH_SIZE])
+        return GLib.SOURCE_CONTINUE
+
+    GLib.idle_add(add_batch)
+
+
+class _FileListing:
+    """File browser popup content: a summary line above a list of rows.
+
+    Rows are added with add(), either all at once or in batches while a
+    tree is still being enumerated; finish() marks the listing complete.
+    cancel() drops the rows and turns later add()/finish() calls into
+    no-ops; producers check *cancelled* to stop early.
 
     Args:
+        toolbar_view: Popup content area to show the listing in.
+        noun: Item noun for the summary of leaf listings.
         base_path: When set, tuples are ``(rel_path, size, is_dir)`` and each
             row gets a folder/file icon plus an *Open in File Manager* button.
             When *None*, tuples are ``(rel_path, size[, desc])`` (leaf listing).
     """
-    total_size = sum(f[1] for f in files)
-    is_leaf = noun != "file"
-
-    main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-
-    # Build summary — split count into files/folders when applicable
-    if base_path is not None:
-        dir_count = sum(1 for f in files if len(f) > 2 and f[2] is True)
-        file_count = len(files) - dir_count
-        parts: list[str] = []
-        if file_count:
-            parts.append(f"{file_count:,} file{'s' if file_count != 1 else ''}")
-        if dir_count:
-            parts.append(f"{dir_count:,} folder{'s' if dir_count != 1 else ''}")
-        summary_text = f"{'  \u00b7  '.join(parts)}  \u00b7  {bytes_to_human(total_size)}"
-    else:
-        summary_text = f"{len(files):,} {noun}{'s' if len(files) != 1 else ''}  \u00b7  {bytes_to_human(total_size)}"
-
-    summary = Gtk.Label(
-        label=summary_text,
-        margin_top=8,
-        margin_bottom=8,
-        margin_start=16,
-        margin_end=16,
-        halign=Gtk.Align.START,
-    )
-    summary.add_css_class("dim-label")
-    main_box.append(summary)
-    main_box.append(Gtk.Separator())
-
-    if not files:
-        status = Adw.StatusPage(
-            icon_name="folder-open-symbolic",
-            title="Empty Directory",
-            description="No files found in this directory.",
-            vexpand=True,
-        )
-        main_box.append(status)
-    else:
-        # Encode items into a StringList with 5 tab-separated fields:
-        #   rel_path \t size \t desc \t icon \t uri
-        string_list = Gtk.StringList()
-        leaf_icon = "system-software-install-symbolic"
-        for f in files:
-            rel_path = f[0]
-            size = f[1]
-            if base_path is not None:
-                is_dir = f[2] if len(f) > 2 else False
-                icon = "folder-symbolic" if is_dir else "text-x-generic-symbolic"
-                full = base_path / rel_path
-                uri = full.as_uri()
-                string_list.append(f"{rel_path}\t{size}\t\t{icon}\t{uri}")
-            else:
-                desc = f[2] if len(f) > 2 else ""
-                string_list.append(f"{rel_path}\t{size}\t{desc}\t{leaf_icon}\t")
-
-        icon_name = leaf_icon if is_leaf else "text-x-generic-symbolic"
+
+    def __init__(self, toolbar_view: Adw.ToolbarView, *, noun: str = "file", base_path: Path | None = None) -> None:
+        self._noun = noun
+        self.cancelled = threading.Event()
+        self._base_uri: str | None = None
+        if base_path is not None:
+            base_uri = base_path.as_uri()
+            self._base_uri = base_uri if base_uri.endswith("/") else base_uri + "/"
+        self._row_count = 0
+        self._total_size = 0
+        self._dir_count = 0
+        self._summary_tick_id: int | None = None
+
+        self._main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+
+        header = Gtk.Box(spacing=8, margin_top=8, margin_bottom=8, margin_start=16, margin_end=16)
+        self._spinner = Gtk.Spinner(spinning=True)
+        header.append(self._spinner)
+        self._summary = Gtk.Label(halign=Gtk.Align.START, css_classes=["dim-label"])
+        header.append(self._summary)
+        self._main_box.append(header)
+        self._main_box.append(Gtk.Separator())
+
+        self._store = Gio.ListStore(item_type=_FileRow)
+        model: Gio.ListModel = self._store
+        if base_path is not None:
+            # Enumerated trees list by path, case-insensitively like file managers;
+            # GTK sorts incrementally as batches arrive
+            sorter = Gtk.StringSorter.new(Gtk.PropertyExpression.new(_FileRow, None, "rel-path"))
+            model = Gtk.SortListModel(model=self._store, sorter=sorter, incremental=True)
         factory = Gtk.SignalListItemFactory()
-        factory.connect("setup", _on_file_item_setup, icon_name)
+        factory.connect("setup", _on_file_item_setup)
         factory.connect("bind", _on_file_item_bind)
 
         list_view = Gtk.ListView(
-            model=Gtk.NoSelection(model=string_list),
+            model=Gtk.NoSelection(model=model),
             factory=factory,
         )
 
-        scrolled = Gtk.ScrolledWindow(vexpand=True)
-        scrolled.set_child(list_view)
-        main_box.append(scrolled)
-
-    toolbar_view.set_content(main_box)
-
-
-def _on_file_item_setup(
-    factory: Gtk.SignalListItemFactory,
-    list_item: Gtk.ListItem,
-    icon_name: str = "text-x-generic-symbolic",
-) -> None:
+        self._scrolled = Gtk.ScrolledWindow(vexpand=True)
+        self._scrolled.set_child(list_view)
+        self._main_box.append(self._scrolled)
+
+        self._update_summary()
+        toolbar_view.set_content(self._main_box)
+
+    def add(self, files: list[tuple[str, int]] | list[tuple[str, int, str]] | list[tuple[str, int, bool]]) -> None:
+        """Append rows for *files*."""
+        if not files or self.cancelled.is_set():
+            return
+        if self._base_uri is not None:
+            base_uri = self._base_uri
+            rows = [
+                _FileRow(rel_path, size, is_dir, _ICONS[is_dir], base_uri=base_uri) for rel_path, size, is_dir in files
+            ]
+            self._dir_count += sum(map(itemgetter(2), files))
+        else:
+            rows = [_FileRow(f[0], f[1], False, _LEAF_ICON, f[2] if len(f) > 2 else "") for f in files]
+
+        # One splice per batch: a single items-changed for the whole batch
+        self._store.splice(self._row_count, 0, rows)
+        self._row_count += len(rows)
+        self._total_size += sum(map(itemgetter(1), files))
+
+        # Several batches can arrive per frame; format the summary once per frame
+        if self._summary_tick_id is None:
+            self._summary_tick_id = self._summary.add_tick_callback(self._on_summary_tick)
+
+    def finish(self) -> None:
+        """Mark the listing complete."""
+        if self.cancelled.is_set():
+            return
+        self._spinner.set_spinning(False)
+        self._spinner.set_visible(False)
+        if self._summary_tick_id is not None:
+            self._summary.remove_tick_callback(self._summary_tick_id)
+            self._summary_tick_id = None
+        self._update_summary()
+
+        if not self._row_count:
+            self._main_box.remove(self._scrolled)
+            status = Adw.StatusPage(
+                icon_name="folder-open-symbolic",
+                title="Empty Directory",
+                description="No files found in this directory.",
+                vexpand=True,
+            )
+            self._main_box.append(status)
+
+    def cancel(self) -> None:
+        """Stop the listing: drop its rows and ignore any batches still in flight."""
+        self.cancelled.set()
+        if self._summary_tick_id is not None:
+            self._summary.remove_tick_callback(self._summary_tick_id)
+            self._summary_tick_id = None
+        self._store.remove_all()
+
+    def _on_summary_tick(self, _label: Gtk.Label, _frame_clock: Gdk.FrameClock) -> bool:
+        self._summary_tick_id = None
+        self._update_summary()
+        return GLib.SOURCE_REMOVE
+
+    def _update_summary(self) -> None:
+        """Show the row count (files/folders split when applicable) and total size."""
+        count = self._row_count
+        if self._base_uri is not None:
+            dir_count = self._dir_count
+            file_count = count - dir_count
+            parts: list[str] = []
+            if file_count:
+                parts.append(f"{file_count:,} file{'s' if file_count != 1 else ''}")
+            if dir_count:
+                parts.append(f"{dir_count:,} folder{'s' if dir_count != 1 else ''}")
+            parts.append(bytes_to_human(self._total_size))
+            summary_text = "  \u00b7  ".join(parts)
+        else:
+            summary_text = (
+                f"{count:,} {self._noun}{'s' if count != 1 else ''}  \u00b7  {bytes_to_human(self._total_size)}"
+            )
+        self._summary.set_label(summary_text)
+
+
+def _on_file_item_setup(factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
     """Create widgets for a file browser list row."""
     box = Gtk.Box(
         spacing=8,
@@ -271,35 +472,29 @@ def _on_file_item_setup(
         margin_bottom=4,
     )
 
-    icon = Gtk.Image.new_from_icon_name(icon_name)
+    icon = Gtk.Image()
     box.append(icon)
 
     labels_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, hexpand=True)
     path_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.MIDDLE)
     labels_box.append(path_label)
 
-    desc_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END)
-    desc_label.add_css_class("caption")
-    desc_label.add_css_class("dim-label")
+    desc_label = Gtk.Label(xalign=0, ellipsize=Pango.EllipsizeMode.END, css_classes=["caption", "dim-label"])
     labels_box.append(desc_label)
 
     box.append(labels_box)
 
-    size_label = Gtk.Label(xalign=1)
-    size_label.add_css_class("numeric")
-    size_label.add_css_class("dim-label")
+    size_label = Gtk.Label(xalign=1, css_classes=["numeric", "dim-label"])
     box.append(size_label)
 
-    open_btn = Gtk.Button.new_from_icon_name("folder-open-symbolic")
-    open_btn.add_css_class("flat")
-    open_btn.set_tooltip_text("Open in File Manager")
-    open_btn.set_valign(Gtk.Align.CENTER)
+    open_btn = flat_icon_button("folder-open-symbolic", "Open in File Manager")
     open_btn.set_visible(False)
-    open_btn._uri = ""
+    open_btn._row = None
     open_btn.connect("clicked", _on_open_in_file_manager)
     box.append(open_btn)
 
     box._icon = icon
+    box._icon_name = None
     box._path_label = path_label
     box._desc_label = desc_label
     box._size_label = size_label
@@ -309,30 +504,23 @@ def _on_file_item_setup(
 
 def _on_file_item_bind(factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
     """Bind file data to a list row."""
-    data = list_item.get_item().get_string()
-    parts = data.split("\t", 4)
-    rel_path = parts[0]
-    size_str = parts[1]
-    desc = parts[2] if len(parts) > 2 else ""
-    icon = parts[3] if len(parts) > 3 else ""
-    uri = parts[4] if len(parts) > 4 else ""
-
+    row: _FileRow = list_item.get_item()
     box = list_item.get_child()
-    box._path_label.set_label(rel_path)
-    box._desc_label.set_label(desc)
-    box._desc_label.set_visible(bool(desc))
-
-    if icon:
-        box._icon.set_from_icon_name(icon)
-
+    box._path_label.set_label(row.rel_path)
+    box._desc_label.set_label(row.desc)
+    box._desc_label.set_visible(bool(row.desc))
+    # Most rows share one of two icons; resetting an unchanged one still reloads it
+    if box._icon_name != row.icon_name:
+        box._icon.set_from_icon_name(row.icon_name)
+        box._icon_name = row.icon_name
     # Hide size for directories (they show 0 which is misleading)
-    is_dir = icon == "folder-symbolic"
-    box._size_label.set_label("" if is_dir else bytes_to_human(int(size_str)))
-
-    box._open_btn.set_visible(bool(uri))
-    box._open_btn._uri = uri
+    box._size_label.set_label("" if row.is_dir else _format_size(row.size))
+    box._open_btn.set_visible(bool(row.base_uri))
+    box._open_btn._row = row
 
 
 def _on_open_in_file_manager(btn: Gtk.Button) -> None:
     """Reveal the item in the system file manager."""
-    reveal_in_file_manager(btn._uri)
+    row: _FileRow = btn._row
+    # Quote the relative path onto the base URI rather than building a Path
+    reveal_in_file_manager(row.base_uri + quote_from_bytes(os.fsencode(row.rel_path)))
@@ -7,10 +7,13 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Adw, Gtk, GLib
+from gi.repository import Adw, Gtk
 
 from sweep.utils import bytes_to_human
 
+# Length of the counting-up animation
+_ANIMATION_MS = 600
+
 
 class SpaceIndicator(Gtk.Box):
     """Animated counter showing bytes freed with a counting-up effect."""
@@ -21,11 +24,8 @@ class SpaceIndicator(Gtk.Box):
             spacing=4,
             halign=Gtk.Align.CENTER,
         )
-        self._target_bytes = 0
-        self._current_bytes = 0
-        self._animation_id: int | None = None
-
-        self.value_label = Gtk.Label(label="0 B")
+        self._label_text = "0 B"
+        self.value_label = Gtk.Label(label=self._label_text)
         self.value_label.add_css_class("title-1")
         self.append(self.value_label)
 
@@ -33,32 +33,36 @@ class SpaceIndicator(Gtk.Box):
         self.subtitle_label.add_css_class("dim-label")
         self.append(self.subtitle_label)
 
+        # Driven by the widget's frame clock, so it follows the compositor's
+        # pacing and does not run while the window is not being drawn
+        self._animation = Adw.TimedAnimation(
+            widget=self,
+            value_from=0,
+            value_to=0,
+            duration=_ANIMATION_MS,
+            easing=Adw.Easing.EASE_OUT_CUBIC,
+            target=Adw.CallbackAnimationTarget.new(self._on_animation_value),
+        )
+
     def set_bytes(self, total_bytes: int, animate: bool = True) -> None:
         """Set the displayed byte count, optionally with animation."""
-        self._target_bytes = total_bytes
+        self._animation.reset()
 
         if not animate or total_bytes == 0:
-            self._current_bytes = total_bytes
-            self.value_label.set_label(bytes_to_human(total_bytes))
+            self._show(total_bytes)
             return
 
-        if self._animation_id is not None:
-            GLib.source_remove(self._animation_id)
-
-        self._current_bytes = 0
-        self._animation_id = GLib.timeout_add(16, self._tick)
-
-    def _tick(self) -> bool:
-        """Animation frame — increment towards target."""
-        remaining = self._target_bytes - self._current_bytes
-        if remaining <= 0:
-            self._current_bytes = self._target_bytes
-            self.value_label.set_label(bytes_to_human(self._target_bytes))
-            self._animation_id = None
-            return False
-
-        # Ease out — larger steps at start, smaller near end
-        step = max(1, remaining // 10)
-        self._current_bytes += step
-        self.value_label.set_label(bytes_to_human(self._current_bytes))
-        return True
+        self._animation.set_value_to(total_bytes)
+        self._animation.play()
+
+    def _on_animation_value(self, value: float) -> None:
+        """Animation frame — show the current eased value."""
+        self._show(int(value))
+
+    def _show(self, size_bytes: int) -> None:
+        # Consecutive frames often format the same ("1.4 GB"); setting an
+        # unchanged label would still make GTK re-lay it out
+        text = bytes_to_human(size_bytes)
+        if text != self._label_text:
+            self._label_text = text
+            self.value_label.set_label(text)
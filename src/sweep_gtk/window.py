@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+import time
 
 import gi
 
@@ -17,6 +18,9 @@ from sweep_gtk.views.modules_list import ModulesView
 from sweep_gtk.views.scan_results import ScanResultsView
 from sweep_gtk.views.settings import SettingsView
 
+# Seconds a plugin listing is reused by scan launches
+_PLUGIN_LIST_TTL = 5.0
+
 
 class SweepWindow(Adw.ApplicationWindow):
     """Main Sweep application window."""
@@ -27,6 +31,7 @@ class SweepWindow(Adw.ApplicationWindow):
         self.set_title("Sweep")
 
         self.client = SweepClient()
+        self._plugin_cache: tuple[float, list[dict]] | None = None
 
         # Toast overlay wraps everything
         self.toast_overlay = Adw.ToastOverlay()
@@ -54,17 +59,21 @@ class SweepWindow(Adw.ApplicationWindow):
             lambda obj, _: switcher_bar.set_reveal(obj.get_title_visible()),
         )
 
-        # Create views
+        # Create views; Modules and Settings are built on their first visit
+        # (see _on_visible_view_changed), keeping them off the startup path
         self.dashboard_view = DashboardView(self)
-        self.modules_view = ModulesView(self)
+        self.modules_view: ModulesView | None = None
         self.scan_results_view = ScanResultsView(self)
-        self.settings_view = SettingsView(self)
+        self.settings_view: SettingsView | None = None
+        self._modules_page = Adw.Bin()
+        self._settings_page = Adw.Bin()
 
         # Add views to stack
         self.view_stack.add_titled_with_icon(self.dashboard_view, "dashboard", "Dashboard", "user-home-symbolic")
-        self.view_stack.add_titled_with_icon(self.modules_view, "modules", "Modules", "application-x-addon-symbolic")
+        self.view_stack.add_titled_with_icon(self._modules_page, "modules", "Modules", "application-x-addon-symbolic")
         self.view_stack.add_titled_with_icon(self.scan_results_view, "results", "Results", "edit-find-symbolic")
-        self.view_stack.add_titled_with_icon(self.settings_view, "settings", "Settings", "emblem-system-symbolic")
+        self.view_stack.add_titled_with_icon(self._settings_page, "settings", "Settings", "emblem-system-symbolic")
+        self.view_stack.connect("notify::visible-child-name", self._on_visible_view_changed)
 
         main_box.append(self.view_stack)
         main_box.append(switcher_bar)
@@ -72,6 +81,31 @@ class SweepWindow(Adw.ApplicationWindow):
         # Start on dashboard
         self.view_stack.set_visible_child_name("dashboard")
 
+    def _on_visible_view_changed(self, stack: Adw.ViewStack, _pspec) -> None:
+        """Build the Modules or Settings view the first time it is shown."""
+        name = stack.get_visible_child_name()
+        if name == "modules" and self.modules_view is None:
+            self.modules_view = ModulesView(self)
+            self._modules_page.set_child(self.modules_view)
+        elif name == "settings" and self.settings_view is None:
+            self.settings_view = SettingsView(self)
+            self._settings_page.set_child(self.settings_view)
+
+    def cached_list_plugins(self) -> list[dict]:
+        """Return the plugin listing, reusing one fetched in the last few seconds.
+
+        Each listing probes every plugin's availability and items on disk,
+        so back-to-back scan launches share one.
+        """
+        now = time.monotonic()
+        if self._plugin_cache is None or now - self._plugin_cache[0] >= _PLUGIN_LIST_TTL:
+            self._plugin_cache = (now, self.client.list_plugins())
+        return self._plugin_cache[1]
+
+    def invalidate_plugin_cache(self) -> None:
+        """Drop the cached plugin listing, e.g. after cleaning or a module toggle."""
+        self._plugin_cache = None
+
     def show_toast(self, message: str, timeout: int = 3) -> None:
         """Show a toast notification."""
         toast = Adw.Toast(title=message, timeout=timeout)
@@ -94,7 +128,7 @@ class SweepWindow(Adw.ApplicationWindow):
             self.show_toast("No modules to scan.")
             return
 
-        plugin_map = {p["id"]: p for p in self.client.list_plugins()}
+        plugin_map = {p["id"]: p for p in self.cached_list_plugins()}
         group_info: dict[str, int] = {}
         for pid in plugin_ids:
             g = plugin_map.get(pid, {}).get("group")
@@ -109,7 +143,7 @@ class SweepWindow(Adw.ApplicationWindow):
 
         def do_scan():
             def on_result(result: dict) -> None:
-                GLib.idle_add(results_view.add_streaming_result, result, generation)
+                results_view.post_streaming_result(result, generation)
 
             self.client.scan_streaming(plugin_ids=plugin_ids, on_result=on_result)
             GLib.idle_add(self._on_launched_scan_complete)
@@ -123,7 +157,7 @@ class SweepWindow(Adw.ApplicationWindow):
         results_view = self.scan_results_view
         elapsed = results_view.finish_streaming_scan()
 
-        total = sum(r["total_bytes"] for r in results_view._scan_results)
+        total = results_view.total_bytes
         time_str = format_elapsed(elapsed)
         if total > 0:
             self.show_toast(f"Found {bytes_to_human(total)} reclaimable space in {time_str}.")
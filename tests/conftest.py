@@ -2,10 +2,33 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+
 import pytest
 
 import sweep.storage as storage
 
+# RAM-backed directory for temporary test trees, when the system has one
+_SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path trees in RAM unless --basetemp was given.
+
+    The tests create many small throwaway files; on tmpfs they never
+    reach the block layer.  The directory is removed when the run ends.
+    """
+    if config.option.basetemp or not os.path.isdir(_SHM_DIR):
+        return
+    try:
+        basetemp = tempfile.mkdtemp(prefix="sweep-tests-", dir=_SHM_DIR)
+    except OSError:
+        return
+    config.option.basetemp = basetemp
+    config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
 
 @pytest.fixture
 def isolate_storage(tmp_path, monkeypatch):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
@@ -11,12 +12,26 @@ from sweep.models.plugin import CleanPlugin
 from sweep.models.scan_result import FileEntry, ScanResult
 from sweep.models.clean_result import CleanResult
 from sweep.core.registry import PluginRegistry
+from sweep.core import engine as _engine
 from sweep.core.engine import SweepEngine
 
 
 class FakePlugin(CleanPlugin):
     """Test plugin that doesn't touch the filesystem."""
 
+    # Slots double as the class-level names that satisfy the abstract properties
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "category",
+        "requires_root",
+        "_available",
+        "_fail",
+        "_scan_delay",
+        "_barrier",
+    )
+
     def __init__(
         self,
         plugin_id: str = "fake",
@@ -24,32 +39,17 @@ class FakePlugin(CleanPlugin):
         fail: bool = False,
         root: bool = False,
         scan_delay: float = 0,
+        barrier: threading.Barrier | None = None,
     ):
-        self._id = plugin_id
+        self.id = plugin_id
+        self.name = f"Fake Plugin ({plugin_id})"
+        self.description = "A fake plugin for testing"
+        self.category = "user"
+        self.requires_root = root
         self._available = available
         self._fail = fail
-        self._root = root
         self._scan_delay = scan_delay
-
-    @property
-    def id(self) -> str:
-        return self._id
-
-    @property
-    def name(self) -> str:
-        return f"Fake Plugin ({self._id})"
-
-    @property
-    def description(self) -> str:
-        return "A fake plugin for testing"
-
-    @property
-    def category(self) -> str:
-        return "user"
-
-    @property
-    def requires_root(self) -> bool:
-        return self._root
+        self._barrier = barrier
 
     def is_available(self) -> bool:
         return self._available
@@ -57,10 +57,12 @@ class FakePlugin(CleanPlugin):
     def scan(self) -> ScanResult:
         if self._scan_delay:
             time.sleep(self._scan_delay)
+        if self._barrier:
+            self._barrier.wait(timeout=1.0)
         if self._fail:
             raise RuntimeError("scan failed")
         return ScanResult(
-            plugin_id=self._id,
+            plugin_id=self.id,
             plugin_name=self.name,
             entries=[FileEntry(path=Path("/tmp/fake"), size_bytes=1024, description="fake file")],
             total_bytes=1024,
@@ -70,7 +72,7 @@ class FakePlugin(CleanPlugin):
     def clean(self, entries: list[FileEntry] | None = None) -> CleanResult:
         if self._fail:
             raise RuntimeError("clean failed")
-        return CleanResult(plugin_id=self._id, freed_bytes=1024, files_removed=1)
+        return CleanResult(plugin_id=self.id, freed_bytes=1024, files_removed=1)
 
 
 @pytest.fixture
@@ -149,10 +151,11 @@ class TestSweepEngine:
         assert engine.get_last_scan("alpha") is None
 
     def test_clean_escalates_root_plugin_via_pkexec(self, monkeypatch):
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: False)
-        monkeypatch.setattr("sweep.core.engine.pkexec_available", lambda: True)
+        monkeypatch.setattr(_engine, "is_root", lambda: False)
+        monkeypatch.setattr(_engine, "pkexec_available", lambda: True)
         monkeypatch.setattr(
-            "sweep.core.engine.run_privileged_clean",
+            _engine,
+            "run_privileged_clean",
             lambda entries: [
                 {"plugin_id": "needs_root", "freed_bytes": 2048, "files_removed": 2, "errors": []},
             ],
@@ -170,8 +173,8 @@ class TestSweepEngine:
         assert not results[0].errors
 
     def test_clean_falls_back_when_pkexec_unavailable(self, monkeypatch):
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: False)
-        monkeypatch.setattr("sweep.core.engine.pkexec_available", lambda: False)
+        monkeypatch.setattr(_engine, "is_root", lambda: False)
+        monkeypatch.setattr(_engine, "pkexec_available", lambda: False)
 
         registry = PluginRegistry()
         registry.register(FakePlugin("needs_root", root=True))
@@ -183,10 +186,11 @@ class TestSweepEngine:
         assert any("pkexec not available" in e for e in results[0].errors)
 
     def test_clean_partitions_root_and_nonroot(self, monkeypatch):
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: False)
-        monkeypatch.setattr("sweep.core.engine.pkexec_available", lambda: True)
+        monkeypatch.setattr(_engine, "is_root", lambda: False)
+        monkeypatch.setattr(_engine, "pkexec_available", lambda: True)
         monkeypatch.setattr(
-            "sweep.core.engine.run_privileged_clean",
+            _engine,
+            "run_privileged_clean",
             lambda entries: [
                 {"plugin_id": "root_plugin", "freed_bytes": 5000, "files_removed": 3, "errors": []},
             ],
@@ -212,10 +216,11 @@ class TestSweepEngine:
     def test_clean_handles_user_cancel(self, monkeypatch):
         from sweep.core.privileges import PrivilegeError
 
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: False)
-        monkeypatch.setattr("sweep.core.engine.pkexec_available", lambda: True)
+        monkeypatch.setattr(_engine, "is_root", lambda: False)
+        monkeypatch.setattr(_engine, "pkexec_available", lambda: True)
         monkeypatch.setattr(
-            "sweep.core.engine.run_privileged_clean",
+            _engine,
+            "run_privileged_clean",
             lambda entries: (_ for _ in ()).throw(PrivilegeError("Authentication dismissed by user")),
         )
 
@@ -239,7 +244,7 @@ class TestSweepEngine:
         assert any("dismissed" in e.lower() for e in root.errors)
 
     def test_clean_allows_root_plugin_when_running_as_root(self, monkeypatch):
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: True)
+        monkeypatch.setattr(_engine, "is_root", lambda: True)
 
         registry = PluginRegistry()
         registry.register(FakePlugin("needs_root", root=True))
@@ -251,7 +256,7 @@ class TestSweepEngine:
         assert not results[0].errors
 
     def test_clean_normal_plugin_still_works(self, monkeypatch):
-        monkeypatch.setattr("sweep.core.engine.is_root", lambda: False)
+        monkeypatch.setattr(_engine, "is_root", lambda: False)
 
         registry = PluginRegistry()
         registry.register(FakePlugin("normal"))
@@ -316,22 +321,22 @@ class TestSweepEngine:
         # has_items defaults to True from base
         assert unavailable.has_items() is True
 
-    def test_scan_runs_plugins_concurrently(self):
+    def test_scan_runs_plugins_concurrently(self, monkeypatch):
         """Plugins scan in parallel via thread pool (4 workers)."""
-        delay = 0.1
+        # The engine scans sequentially on single-CPU hosts
+        monkeypatch.setattr(_engine.os, "cpu_count", lambda: 4)
         count = 4
+        # Only met if all scans are in flight at once; sequential scans break it
+        barrier = threading.Barrier(count)
         registry = PluginRegistry()
         for i in range(count):
-            registry.register(FakePlugin(f"slow_{i}", scan_delay=delay))
+            registry.register(FakePlugin(f"slow_{i}", barrier=barrier))
         engine = SweepEngine(registry)
 
-        start = time.monotonic()
         results = engine.scan()
-        elapsed = time.monotonic() - start
 
         assert len(results) == count
-        # Sequential would take count * delay = 0.4s; parallel should be ~0.1s
-        assert elapsed < delay * count * 0.75
+        assert all(not r.error for r in results)
 
     def test_scan_single_plugin_no_overhead(self):
         """A single plugin skips the thread pool (len < 2)."""
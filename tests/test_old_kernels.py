@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import os
+import platform
+import shutil
 import time
 from pathlib import Path
-from unittest.mock import patch
+from typing import Iterator
 
 import pytest
 
+from sweep.models.scan_result import ScanResult
+from sweep.plugins import old_kernels
 from sweep.plugins.old_kernels import (
     OldKernelsPlugin,
     OldKernelModulesPlugin,
@@ -24,23 +28,74 @@ from sweep.plugins.old_kernels import (
 # ---------------------------------------------------------------------------
 
 
+def _write(path: Path, data: bytes) -> None:
+    """Create *path* holding *data* with one open/write/close, skipping Python's buffered file layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _make_file(path: Path, size: int) -> None:
+    """Create *path* as a sparse file of *size* bytes.
+
+    The plugins only look at names, sizes and mtimes, so no data is written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _clone(prototype: Path, tmp_path: Path) -> Path:
+    """Copy a prototype tree into *tmp_path* for one test, keeping symlinks as symlinks."""
+    root = tmp_path / "root"
+    shutil.copytree(prototype, root, symlinks=True)
+    return root
+
+
+def _names(result: ScanResult) -> set[str]:
+    """Names of the files and directories a scan marked for deletion."""
+    return {e.path.name for e in result.entries}
+
+
+def _iter_paths(root: Path) -> Iterator[str]:
+    """Yield the path of everything below *root*, walking with os.scandir."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                yield entry.path
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _patch_tree(mp: pytest.MonkeyPatch, root: Path, running: str) -> None:
+    """Point the plugins at the fake /boot, /lib/modules and /usr/src (*root*/boot, modules, src)."""
+    mp.setattr(old_kernels, "_BOOT_DIR", root / "boot")
+    mp.setattr(old_kernels, "_MODULES_DIR", root / "modules")
+    mp.setattr(old_kernels, "_SOURCES_DIR", root / "src")
+    mp.setattr(platform, "release", lambda: running)
+
+
 def _make_kernel(boot: Path, version: str, age_offset: float = 0) -> None:
     """Create a full set of kernel files in a fake /boot."""
     for prefix in ("vmlinuz-", "System.map-", "config-"):
-        f = boot / f"{prefix}{version}"
-        f.write_bytes(b"k" * 1024)
+        _make_file(boot / f"{prefix}{version}", 1024)
     if age_offset:
-        mtime = time.time() - age_offset
-        for prefix in ("vmlinuz-", "System.map-", "config-"):
-            os.utime(boot / f"{prefix}{version}", (mtime, mtime))
+        # The plugins order kernels by the vmlinuz image's mtime alone
+        mtime_ns = time.time_ns() - int(age_offset * 1_000_000_000)
+        os.utime(boot / f"vmlinuz-{version}", ns=(mtime_ns, mtime_ns))
 
 
 def _make_modules(modules: Path, version: str, size: int = 4096) -> None:
     """Create a fake /lib/modules/<version>/ directory."""
     d = modules / version
-    d.mkdir(parents=True, exist_ok=True)
-    (d / "modules.dep").write_bytes(b"m" * size)
-    (d / "modules.alias").write_bytes(b"a" * (size // 2))
+    d.mkdir(exist_ok=True)
+    _make_file(d / "modules.dep", size)
+    _make_file(d / "modules.alias", size // 2)
 
 
 def _make_arch_modules(
@@ -51,15 +106,15 @@ def _make_arch_modules(
 ) -> None:
     """Create a fake Arch-style /lib/modules/<version>/ with pkgbase."""
     _make_modules(modules, version, size)
-    (modules / version / "pkgbase").write_text(f"{pkgbase_name}\n")
+    _write(modules / version / "pkgbase", f"{pkgbase_name}\n".encode())
 
 
 def _make_sources(usr_src: Path, version: str, size: int = 8192) -> Path:
     """Create a fake /usr/src/linux-<version>/ source tree."""
     d = usr_src / f"linux-{version}"
-    d.mkdir(parents=True, exist_ok=True)
-    (d / "Makefile").write_bytes(b"M" * size)
-    (d / ".config").write_bytes(b"C" * (size // 4))
+    d.mkdir(exist_ok=True)
+    _make_file(d / "Makefile", size)
+    _make_file(d / ".config", size // 4)
     return d
 
 
@@ -73,18 +128,20 @@ class TestGentooSystem:
 
     RUNNING = "6.12.58-gentoo-x86_64"
 
-    @pytest.fixture
-    def gentoo(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gentoo_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("gentoo")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
         # Non-kernel files that must survive
         grub = boot / "grub"
         grub.mkdir()
         (grub / "grub.cfg").write_text("menuentry {}")
-        (boot / "amd-uc.img").write_bytes(b"u" * 512)
+        _make_file(boot / "amd-uc.img", 512)
         (boot / ".keep").write_text("")
 
         # Kernels: newest → oldest
@@ -104,12 +161,31 @@ class TestGentooSystem:
         ):
             _make_modules(modules, ver)
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield boot, modules
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gentoo(cls, gentoo_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, gentoo_tree, cls.RUNNING)
+            yield gentoo_tree / "boot", gentoo_tree / "modules"
+
+    @pytest.fixture
+    def gentoo_copy(self, gentoo_tree, tmp_path, monkeypatch):
+        """A private copy of the tree, for tests that clean."""
+        root = _clone(gentoo_tree, tmp_path)
+        _patch_tree(monkeypatch, root, self.RUNNING)
+        return root / "boot", root / "modules"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def boot_scan(cls, gentoo):
+        return OldKernelsPlugin().scan()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def modules_scan(cls, gentoo):
+        return OldKernelModulesPlugin().scan()
 
     def test_boot_keeps_running_and_one_previous(self, gentoo):
         keep = _boot_keep_versions()
@@ -117,10 +193,9 @@ class TestGentooSystem:
         assert "6.12.41-gentoo-x86_64" in keep  # most recent previous
         assert len(keep) == 2
 
-    def test_boot_scan_deletes_old_kernels(self, gentoo):
+    def test_boot_scan_deletes_old_kernels(self, gentoo, boot_scan):
         boot, _ = gentoo
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+        deleted_names = _names(boot_scan)
 
         # Old kernels are marked for deletion
         assert "vmlinuz-6.12.16-gentoo-x86_64" in deleted_names
@@ -128,17 +203,15 @@ class TestGentooSystem:
         assert "System.map-6.12.16-gentoo-x86_64" in deleted_names
         assert "config-6.6.58-gentoo-r1-x86_64" in deleted_names
 
-    def test_boot_scan_keeps_recent_kernels(self, gentoo):
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+    def test_boot_scan_keeps_recent_kernels(self, boot_scan):
+        deleted_names = _names(boot_scan)
 
         assert "vmlinuz-6.12.58-gentoo-x86_64" not in deleted_names
         assert "vmlinuz-6.12.41-gentoo-x86_64" not in deleted_names
 
-    def test_boot_scan_never_touches_non_kernel_files(self, gentoo):
+    def test_boot_scan_never_touches_non_kernel_files(self, gentoo, boot_scan):
         boot, _ = gentoo
-        result = OldKernelsPlugin().scan()
-        deleted_paths = {e.path for e in result.entries}
+        deleted_paths = {e.path for e in boot_scan.entries}
 
         # grub, microcode, .keep must never appear in scan results
         assert boot / "grub" not in deleted_paths
@@ -146,8 +219,8 @@ class TestGentooSystem:
         assert boot / "amd-uc.img" not in deleted_paths
         assert boot / ".keep" not in deleted_paths
 
-    def test_boot_clean_preserves_non_kernel_files(self, gentoo):
-        boot, _ = gentoo
+    def test_boot_clean_preserves_non_kernel_files(self, gentoo_copy):
+        boot, _ = gentoo_copy
         plugin = OldKernelsPlugin()
         entries = plugin.scan().entries
         plugin.clean(entries)
@@ -174,18 +247,16 @@ class TestGentooSystem:
         assert "6.12.16-gentoo-x86_64" in keep
         assert "6.6.58-gentoo-r1-x86_64" in keep
 
-    def test_modules_scan_deletes_orphans(self, gentoo):
-        result = OldKernelModulesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_modules_scan_deletes_orphans(self, modules_scan):
+        deleted = _names(modules_scan)
 
         # Only truly orphaned modules (no vmlinuz in /boot)
         assert "6.1.67-gentoo-x86_64" in deleted
         assert "5.15.88-gentoo-x86_64" in deleted
-        assert len(result.entries) == 2
+        assert len(modules_scan.entries) == 2
 
-    def test_modules_scan_keeps_all_installed_versions(self, gentoo):
-        result = OldKernelModulesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_modules_scan_keeps_all_installed_versions(self, modules_scan):
+        deleted = _names(modules_scan)
 
         assert "6.12.58-gentoo-x86_64" not in deleted
         assert "6.12.41-gentoo-x86_64" not in deleted
@@ -203,22 +274,24 @@ class TestArchSystem:
 
     RUNNING = "6.12.2-arch1-1"
 
-    @pytest.fixture
-    def arch(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def arch_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("arch")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
         # Arch-style boot files (no version in filename)
-        (boot / "vmlinuz-linux").write_bytes(b"k" * 2048)
-        (boot / "vmlinuz-linux-lts").write_bytes(b"k" * 2048)
-        (boot / "initramfs-linux.img").write_bytes(b"i" * 4096)
-        (boot / "initramfs-linux-lts.img").write_bytes(b"i" * 4096)
-        (boot / "initramfs-linux-fallback.img").write_bytes(b"i" * 8192)
+        _make_file(boot / "vmlinuz-linux", 2048)
+        _make_file(boot / "vmlinuz-linux-lts", 2048)
+        _make_file(boot / "initramfs-linux.img", 4096)
+        _make_file(boot / "initramfs-linux-lts.img", 4096)
+        _make_file(boot / "initramfs-linux-fallback.img", 8192)
         (boot / "grub").mkdir()
         (boot / "grub" / "grub.cfg").write_text("menuentry {}")
-        (boot / "intel-ucode.img").write_bytes(b"u" * 512)
+        _make_file(boot / "intel-ucode.img", 512)
 
         # Installed kernel packages (with pkgbase)
         _make_arch_modules(modules, "6.12.2-arch1-1", "linux")
@@ -227,12 +300,24 @@ class TestArchSystem:
         # Orphan: old version, package uninstalled (no pkgbase)
         _make_modules(modules, "6.11.8-arch1-1")
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield boot, modules
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def arch(cls, arch_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, arch_tree, cls.RUNNING)
+            yield arch_tree / "boot", arch_tree / "modules"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def boot_scan(cls, arch):
+        return OldKernelsPlugin().scan()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def modules_scan(cls, arch):
+        return OldKernelModulesPlugin().scan()
 
     def test_protected_includes_pkgbase_names(self, arch):
         protected = _protected_versions()
@@ -245,9 +330,8 @@ class TestArchSystem:
         assert "linux" in protected
         assert "linux-lts" in protected
 
-    def test_boot_never_deletes_arch_kernels(self, arch):
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+    def test_boot_never_deletes_arch_kernels(self, boot_scan):
+        deleted_names = _names(boot_scan)
 
         # vmlinuz-linux and vmlinuz-linux-lts must never be deleted
         assert "vmlinuz-linux" not in deleted_names
@@ -256,28 +340,25 @@ class TestArchSystem:
         assert "initramfs-linux-lts.img" not in deleted_names
         assert "initramfs-linux-fallback.img" not in deleted_names
 
-    def test_boot_never_touches_grub(self, arch):
+    def test_boot_never_touches_grub(self, arch, boot_scan):
         boot, _ = arch
-        result = OldKernelsPlugin().scan()
-        deleted_paths = {e.path for e in result.entries}
+        deleted_paths = {e.path for e in boot_scan.entries}
 
         assert boot / "grub" not in deleted_paths
         assert boot / "grub" / "grub.cfg" not in deleted_paths
         assert boot / "intel-ucode.img" not in deleted_paths
 
-    def test_modules_keeps_installed_packages(self, arch):
-        result = OldKernelModulesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_modules_keeps_installed_packages(self, modules_scan):
+        deleted = _names(modules_scan)
 
         assert "6.12.2-arch1-1" not in deleted
         assert "6.6.50-1-lts" not in deleted
 
-    def test_modules_deletes_orphan(self, arch):
-        result = OldKernelModulesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_modules_deletes_orphan(self, modules_scan):
+        deleted = _names(modules_scan)
 
         assert "6.11.8-arch1-1" in deleted
-        assert len(result.entries) == 1
+        assert len(modules_scan.entries) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -290,27 +371,31 @@ class TestArchThreeKernels:
 
     RUNNING = "6.12.2-arch1-1"
 
-    @pytest.fixture
-    def arch3(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def arch3_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("arch3")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
-        (boot / "vmlinuz-linux").write_bytes(b"k" * 1024)
-        (boot / "vmlinuz-linux-lts").write_bytes(b"k" * 1024)
-        (boot / "vmlinuz-linux-zen").write_bytes(b"k" * 1024)
+        _make_file(boot / "vmlinuz-linux", 1024)
+        _make_file(boot / "vmlinuz-linux-lts", 1024)
+        _make_file(boot / "vmlinuz-linux-zen", 1024)
 
         _make_arch_modules(modules, "6.12.2-arch1-1", "linux")
         _make_arch_modules(modules, "6.6.50-1-lts", "linux-lts")
         _make_arch_modules(modules, "6.12.2.zen1-1", "linux-zen")
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield boot, modules
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def arch3(cls, arch3_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, arch3_tree, cls.RUNNING)
+            yield arch3_tree / "boot", arch3_tree / "modules"
 
     def test_all_three_kernels_protected(self, arch3):
         """All installed Arch packages are kept even when > _KEEP_LATEST."""
@@ -332,50 +417,65 @@ class TestBootSafety:
 
     RUNNING = "6.1.0-current"
 
-    @pytest.fixture
-    def boot_with_extras(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def boot_with_extras_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("boot_with_extras")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
         # Non-kernel contents that must survive
         (boot / "grub").mkdir()
         (boot / "grub" / "grub.cfg").write_text("menuentry {}")
-        (boot / "grub" / "grubenv").write_bytes(b"e" * 128)
+        _make_file(boot / "grub" / "grubenv", 128)
         (boot / "grub" / "fonts").mkdir()
-        (boot / "grub" / "fonts" / "unicode.pf2").write_bytes(b"f" * 256)
+        _make_file(boot / "grub" / "fonts" / "unicode.pf2", 256)
         (boot / "EFI").mkdir()
         (boot / "EFI" / "BOOT").mkdir()
-        (boot / "EFI" / "BOOT" / "BOOTX64.EFI").write_bytes(b"e" * 512)
+        _make_file(boot / "EFI" / "BOOT" / "BOOTX64.EFI", 512)
         (boot / "loader").mkdir()
         (boot / "loader" / "loader.conf").write_text("default arch")
         (boot / "loader" / "entries").mkdir()
         (boot / "loader" / "entries" / "arch.conf").write_text("title Arch")
-        (boot / "intel-ucode.img").write_bytes(b"u" * 1024)
-        (boot / "amd-ucode.img").write_bytes(b"u" * 1024)
+        _make_file(boot / "intel-ucode.img", 1024)
+        _make_file(boot / "amd-ucode.img", 1024)
         (boot / ".keep").write_text("")
-        (boot / "memtest86+.bin").write_bytes(b"t" * 512)
+        _make_file(boot / "memtest86+.bin", 512)
 
         # Kernels: 3 versions, keep 2
         _make_kernel(boot, "6.1.0-current", age_offset=0)
         _make_kernel(boot, "6.1.0-previous", age_offset=100)
         _make_kernel(boot, "5.15.0-old", age_offset=200)
         # Also add initramfs for the old one
-        (boot / "initramfs-5.15.0-old.img").write_bytes(b"r" * 2048)
+        _make_file(boot / "initramfs-5.15.0-old.img", 2048)
 
         _make_modules(modules, "6.1.0-current")
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield boot
+        return root
 
-    def test_scan_only_matches_kernel_files(self, boot_with_extras):
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+    @pytest.fixture(scope="class")
+    @classmethod
+    def boot_with_extras(cls, boot_with_extras_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, boot_with_extras_tree, cls.RUNNING)
+            yield boot_with_extras_tree / "boot"
+
+    @pytest.fixture
+    def boot_with_extras_copy(self, boot_with_extras_tree, tmp_path, monkeypatch):
+        """A private copy of the tree, for tests that clean."""
+        root = _clone(boot_with_extras_tree, tmp_path)
+        _patch_tree(monkeypatch, root, self.RUNNING)
+        return root / "boot"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def boot_scan(cls, boot_with_extras):
+        return OldKernelsPlugin().scan()
+
+    def test_scan_only_matches_kernel_files(self, boot_scan):
+        deleted_names = _names(boot_scan)
 
         # Only the old kernel's files should appear
         assert deleted_names == {
@@ -385,48 +485,19 @@ class TestBootSafety:
             "initramfs-5.15.0-old.img",
         }
 
-    def test_grub_dir_untouched(self, boot_with_extras):
-        boot = boot_with_extras
-        result = OldKernelsPlugin().scan()
-        all_paths = {str(e.path) for e in result.entries}
-
-        for grub_file in boot.joinpath("grub").rglob("*"):
-            assert str(grub_file) not in all_paths
-
-    def test_efi_dir_untouched(self, boot_with_extras):
-        boot = boot_with_extras
-        result = OldKernelsPlugin().scan()
-        all_paths = {str(e.path) for e in result.entries}
-
-        for efi_file in boot.joinpath("EFI").rglob("*"):
-            assert str(efi_file) not in all_paths
-
-    def test_bootloader_entries_untouched(self, boot_with_extras):
-        boot = boot_with_extras
-        result = OldKernelsPlugin().scan()
-        all_paths = {str(e.path) for e in result.entries}
-
-        for loader_file in boot.joinpath("loader").rglob("*"):
-            assert str(loader_file) not in all_paths
-
-    def test_microcode_untouched(self, boot_with_extras):
-        boot = boot_with_extras
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
-
-        assert "intel-ucode.img" not in deleted_names
-        assert "amd-ucode.img" not in deleted_names
+    @pytest.mark.parametrize("subdir", ["grub", "EFI", "loader"])
+    def test_bootloader_dirs_untouched(self, boot_with_extras, boot_scan, subdir):
+        all_paths = {str(e.path) for e in boot_scan.entries}
 
-    def test_other_boot_files_untouched(self, boot_with_extras):
-        boot = boot_with_extras
-        result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+        for path in _iter_paths(boot_with_extras / subdir):
+            assert path not in all_paths
 
-        assert ".keep" not in deleted_names
-        assert "memtest86+.bin" not in deleted_names
+    @pytest.mark.parametrize("name", ["intel-ucode.img", "amd-ucode.img", ".keep", "memtest86+.bin"])
+    def test_other_boot_files_untouched(self, boot_scan, name):
+        assert name not in _names(boot_scan)
 
-    def test_clean_preserves_everything_except_old_kernel(self, boot_with_extras):
-        boot = boot_with_extras
+    def test_clean_preserves_everything_except_old_kernel(self, boot_with_extras_copy):
+        boot = boot_with_extras_copy
         plugin = OldKernelsPlugin()
         entries = plugin.scan().entries
         plugin.clean(entries)
@@ -492,23 +563,19 @@ class TestPluginProperties:
 
 
 class TestUnavailable:
-    def test_boot_unavailable_when_no_boot(self, tmp_path):
-        with patch("sweep.plugins.old_kernels._BOOT_DIR", tmp_path / "noboot"):
-            p = OldKernelsPlugin()
-            assert p.unavailable_reason is not None
-            assert not p.is_available()
-
-    def test_modules_unavailable_when_no_modules(self, tmp_path):
-        with patch("sweep.plugins.old_kernels._MODULES_DIR", tmp_path / "nomods"):
-            p = OldKernelModulesPlugin()
-            assert p.unavailable_reason is not None
-            assert not p.is_available()
-
-    def test_sources_unavailable_when_no_usr_src(self, tmp_path):
-        with patch("sweep.plugins.old_kernels._SOURCES_DIR", tmp_path / "nosrc"):
-            p = OldKernelSourcesPlugin()
-            assert p.unavailable_reason is not None
-            assert not p.is_available()
+    @pytest.mark.parametrize(
+        ("attr", "plugin_cls"),
+        [
+            ("_BOOT_DIR", OldKernelsPlugin),
+            ("_MODULES_DIR", OldKernelModulesPlugin),
+            ("_SOURCES_DIR", OldKernelSourcesPlugin),
+        ],
+    )
+    def test_unavailable_when_dir_missing(self, tmp_path, monkeypatch, attr, plugin_cls):
+        monkeypatch.setattr(old_kernels, attr, tmp_path / "missing")
+        p = plugin_cls()
+        assert p.unavailable_reason is not None
+        assert not p.is_available()
 
 
 class TestEdgeCases:
@@ -516,22 +583,25 @@ class TestEdgeCases:
 
     RUNNING = "6.12.0-only"
 
-    @pytest.fixture
-    def single_kernel(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def single_kernel_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("single_kernel")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
         _make_kernel(boot, "6.12.0-only")
         _make_modules(modules, "6.12.0-only")
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield boot, modules
+        return root
+
+    @pytest.fixture
+    def single_kernel(self, single_kernel_tree, monkeypatch):
+        # Function-scoped: this class patches in two different trees
+        _patch_tree(monkeypatch, single_kernel_tree, self.RUNNING)
+        return single_kernel_tree / "boot", single_kernel_tree / "modules"
 
     def test_single_kernel_nothing_to_delete(self, single_kernel):
         assert OldKernelsPlugin().scan().entries == []
@@ -540,40 +610,40 @@ class TestEdgeCases:
     def test_single_kernel_has_items_false(self, single_kernel):
         assert OldKernelsPlugin().has_items() is False
 
-    @pytest.fixture
-    def updated_not_rebooted(self, tmp_path):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def updated_not_rebooted_tree(cls, tmp_path_factory):
         """Simulates a kernel update before reboot (Arch scenario)."""
-        boot = tmp_path / "boot"
+        root = tmp_path_factory.mktemp("updated_not_rebooted")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
 
         # New kernel installed, old one still running
-        (boot / "vmlinuz-linux").write_bytes(b"k" * 1024)
+        _make_file(boot / "vmlinuz-linux", 1024)
         _make_arch_modules(modules, "6.13.0-arch1-1", "linux")
         # Old running kernel's modules might still exist
         _make_modules(modules, "6.12.2-arch1-1")
 
-        running = "6.12.2-arch1-1"
+        return root
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("platform.release", return_value=running),
-        ):
-            yield boot, modules
+    @pytest.fixture
+    def updated_not_rebooted(self, updated_not_rebooted_tree, monkeypatch):
+        _patch_tree(monkeypatch, updated_not_rebooted_tree, "6.12.2-arch1-1")
+        return updated_not_rebooted_tree / "boot", updated_not_rebooted_tree / "modules"
 
     def test_running_kernel_always_protected(self, updated_not_rebooted):
         """Even if the running kernel has no vmlinuz, its modules are safe."""
         result = OldKernelModulesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+        deleted = _names(result)
 
         assert "6.12.2-arch1-1" not in deleted  # running
         assert "6.13.0-arch1-1" not in deleted  # has pkgbase
 
     def test_boot_keeps_new_kernel_after_update(self, updated_not_rebooted):
         result = OldKernelsPlugin().scan()
-        deleted_names = {e.path.name for e in result.entries}
+        deleted_names = _names(result)
 
         # vmlinuz-linux maps to "linux" in pkgbase → protected
         assert "vmlinuz-linux" not in deleted_names
@@ -589,14 +659,16 @@ class TestGentooSources:
 
     RUNNING = "6.12.58-gentoo-x86_64"
 
-    @pytest.fixture
-    def gentoo_src(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gentoo_src_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("gentoo_src")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
-        usr_src = tmp_path / "usr" / "src"
-        usr_src.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
+        usr_src = root / "src"
+        usr_src.mkdir()
 
         # Only the current kernel in /boot
         _make_kernel(boot, "6.12.58-gentoo-x86_64")
@@ -610,22 +682,36 @@ class TestGentooSources:
         _make_sources(usr_src, "6.6.47-gentoo")
         _make_sources(usr_src, "6.6.38-gentoo")
 
-        # /usr/src/linux symlink → current sources
-        (usr_src / "linux").symlink_to(current)
+        # /usr/src/linux symlink → current sources, relative like eselect makes it,
+        # so copies of the tree point at their own sources
+        (usr_src / "linux").symlink_to(current.name)
 
         # Non-kernel dirs that must survive
         (usr_src / "linux-firmware").mkdir()
-        (usr_src / "linux-firmware" / "amd").write_bytes(b"f" * 512)
+        _make_file(usr_src / "linux-firmware" / "amd", 512)
         (usr_src / "debug").mkdir()
-        (usr_src / "debug" / "info").write_bytes(b"d" * 256)
+        _make_file(usr_src / "debug" / "info", 256)
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("sweep.plugins.old_kernels._SOURCES_DIR", usr_src),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield usr_src
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gentoo_src(cls, gentoo_src_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, gentoo_src_tree, cls.RUNNING)
+            yield gentoo_src_tree / "src"
+
+    @pytest.fixture
+    def gentoo_src_copy(self, gentoo_src_tree, tmp_path, monkeypatch):
+        """A private copy of the tree, for tests that clean."""
+        root = _clone(gentoo_src_tree, tmp_path)
+        _patch_tree(monkeypatch, root, self.RUNNING)
+        return root / "src"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sources_scan(cls, gentoo_src):
+        return OldKernelSourcesPlugin().scan()
 
     def test_keep_names_includes_current(self, gentoo_src):
         keep = _sources_keep_names()
@@ -636,53 +722,49 @@ class TestGentooSources:
         assert "linux-6.6.38-gentoo" not in keep
         assert "linux-6.6.47-gentoo" not in keep
 
-    def test_scan_removes_orphaned_sources(self, gentoo_src):
-        result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_scan_removes_orphaned_sources(self, sources_scan):
+        deleted = _names(sources_scan)
 
         assert "linux-6.12.41-gentoo" in deleted
         assert "linux-6.12.16-gentoo" in deleted
         assert "linux-6.6.58-gentoo-r1" in deleted
         assert "linux-6.6.47-gentoo" in deleted
         assert "linux-6.6.38-gentoo" in deleted
-        assert len(result.entries) == 5
+        assert len(sources_scan.entries) == 5
 
-    def test_scan_keeps_current_sources(self, gentoo_src):
-        result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_scan_keeps_current_sources(self, sources_scan):
+        deleted = _names(sources_scan)
 
         assert "linux-6.12.58-gentoo" not in deleted
 
-    def test_scan_never_touches_non_kernel_dirs(self, gentoo_src):
-        result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_scan_never_touches_non_kernel_dirs(self, sources_scan):
+        deleted = _names(sources_scan)
 
         assert "linux-firmware" not in deleted
         assert "debug" not in deleted
         assert "linux" not in deleted  # symlink
 
-    def test_scan_never_touches_symlink(self, gentoo_src):
-        result = OldKernelSourcesPlugin().scan()
-        deleted_paths = {e.path for e in result.entries}
+    def test_scan_never_touches_symlink(self, gentoo_src, sources_scan):
+        deleted_paths = {e.path for e in sources_scan.entries}
 
         assert gentoo_src / "linux" not in deleted_paths
 
-    def test_clean_removes_old_preserves_current(self, gentoo_src):
+    def test_clean_removes_old_preserves_current(self, gentoo_src_copy):
         plugin = OldKernelSourcesPlugin()
         entries = plugin.scan().entries
         plugin.clean(entries)
 
         # Current sources survive
-        assert (gentoo_src / "linux-6.12.58-gentoo").exists()
-        assert (gentoo_src / "linux-6.12.58-gentoo" / "Makefile").exists()
+        assert (gentoo_src_copy / "linux-6.12.58-gentoo").exists()
+        assert (gentoo_src_copy / "linux-6.12.58-gentoo" / "Makefile").exists()
 
         # Old sources are gone
-        assert not (gentoo_src / "linux-6.12.41-gentoo").exists()
-        assert not (gentoo_src / "linux-6.6.38-gentoo").exists()
+        assert not (gentoo_src_copy / "linux-6.12.41-gentoo").exists()
+        assert not (gentoo_src_copy / "linux-6.6.38-gentoo").exists()
 
         # Non-kernel dirs survive
-        assert (gentoo_src / "linux-firmware" / "amd").exists()
-        assert (gentoo_src / "debug" / "info").exists()
+        assert (gentoo_src_copy / "linux-firmware" / "amd").exists()
+        assert (gentoo_src_copy / "debug" / "info").exists()
 
     def test_has_items_true(self, gentoo_src):
         assert OldKernelSourcesPlugin().has_items() is True
@@ -693,14 +775,16 @@ class TestSourcesWithMultipleBootKernels:
 
     RUNNING = "6.12.58-gentoo-x86_64"
 
-    @pytest.fixture
-    def src_with_boot(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def src_with_boot_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("src_with_boot")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
-        usr_src = tmp_path / "usr" / "src"
-        usr_src.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
+        usr_src = root / "src"
+        usr_src.mkdir()
 
         # Two kernels in /boot
         _make_kernel(boot, "6.12.58-gentoo-x86_64")
@@ -710,27 +794,31 @@ class TestSourcesWithMultipleBootKernels:
         current = _make_sources(usr_src, "6.12.58-gentoo")
         _make_sources(usr_src, "6.12.41-gentoo")
         _make_sources(usr_src, "6.6.38-gentoo")
-        (usr_src / "linux").symlink_to(current)
+        (usr_src / "linux").symlink_to(current.name)
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("sweep.plugins.old_kernels._SOURCES_DIR", usr_src),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield usr_src
+        return root
 
-    def test_keeps_sources_with_boot_images(self, src_with_boot):
-        result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    @pytest.fixture(scope="class")
+    @classmethod
+    def src_with_boot(cls, src_with_boot_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, src_with_boot_tree, cls.RUNNING)
+            yield src_with_boot_tree / "src"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sources_scan(cls, src_with_boot):
+        return OldKernelSourcesPlugin().scan()
+
+    def test_keeps_sources_with_boot_images(self, sources_scan):
+        deleted = _names(sources_scan)
 
         # Both have matching vmlinuz in /boot
         assert "linux-6.12.58-gentoo" not in deleted
         assert "linux-6.12.41-gentoo" not in deleted
 
-    def test_removes_orphan_only(self, src_with_boot):
-        result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+    def test_removes_orphan_only(self, sources_scan):
+        deleted = _names(sources_scan)
 
         assert deleted == {"linux-6.6.38-gentoo"}
 
@@ -740,26 +828,29 @@ class TestSourcesSingleKernel:
 
     RUNNING = "6.12.58-gentoo-x86_64"
 
-    @pytest.fixture
-    def single_src(self, tmp_path):
-        boot = tmp_path / "boot"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def single_src_tree(cls, tmp_path_factory):
+        root = tmp_path_factory.mktemp("single_src")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
-        usr_src = tmp_path / "usr" / "src"
-        usr_src.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
+        usr_src = root / "src"
+        usr_src.mkdir()
 
         _make_kernel(boot, "6.12.58-gentoo-x86_64")
         current = _make_sources(usr_src, "6.12.58-gentoo")
-        (usr_src / "linux").symlink_to(current)
+        (usr_src / "linux").symlink_to(current.name)
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("sweep.plugins.old_kernels._SOURCES_DIR", usr_src),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield usr_src
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def single_src(cls, single_src_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, single_src_tree, cls.RUNNING)
+            yield single_src_tree / "src"
 
     def test_nothing_to_delete(self, single_src):
         assert OldKernelSourcesPlugin().scan().entries == []
@@ -773,33 +864,36 @@ class TestSourcesSymlinkProtection:
 
     RUNNING = "6.1.0-different"
 
-    @pytest.fixture
-    def symlink_mismatch(self, tmp_path):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def symlink_mismatch_tree(cls, tmp_path_factory):
         """Symlink points to sources that don't match the running kernel."""
-        boot = tmp_path / "boot"
+        root = tmp_path_factory.mktemp("symlink_mismatch")
+        boot = root / "boot"
         boot.mkdir()
-        modules = tmp_path / "lib" / "modules"
-        modules.mkdir(parents=True)
-        usr_src = tmp_path / "usr" / "src"
-        usr_src.mkdir(parents=True)
+        modules = root / "modules"
+        modules.mkdir()
+        usr_src = root / "src"
+        usr_src.mkdir()
 
         _make_kernel(boot, "6.1.0-different")
         # Symlink points to 6.12.58 but running kernel is 6.1.0
         target = _make_sources(usr_src, "6.12.58-gentoo")
         _make_sources(usr_src, "6.6.38-gentoo")
-        (usr_src / "linux").symlink_to(target)
+        (usr_src / "linux").symlink_to(target.name)
 
-        with (
-            patch("sweep.plugins.old_kernels._BOOT_DIR", boot),
-            patch("sweep.plugins.old_kernels._MODULES_DIR", modules),
-            patch("sweep.plugins.old_kernels._SOURCES_DIR", usr_src),
-            patch("platform.release", return_value=self.RUNNING),
-        ):
-            yield usr_src
+        return root
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def symlink_mismatch(cls, symlink_mismatch_tree):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_tree(mp, symlink_mismatch_tree, cls.RUNNING)
+            yield symlink_mismatch_tree / "src"
 
     def test_symlink_target_always_kept(self, symlink_mismatch):
         result = OldKernelSourcesPlugin().scan()
-        deleted = {e.path.name for e in result.entries}
+        deleted = _names(result)
 
         # Symlink target is protected even though it doesn't match uname -r
         assert "linux-6.12.58-gentoo" not in deleted
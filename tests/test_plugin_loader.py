@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import pytest
 
 from sweep.core.registry import PluginRegistry
-from sweep.core.plugin_loader import load_plugins, _find_plugins_in_module
+from sweep.core.plugin_loader import load_plugins, _find_plugins_in_module, _load_builtin_plugins
 
 
 class TestPluginRegistry:
@@ -63,3 +64,32 @@ class TestPluginLoader:
         load_plugins(registry)
         ids = [p.id for p in registry]
         assert len(ids) == len(set(ids))
+
+    def test_builtin_discovery_is_cached(self):
+        first, second = PluginRegistry(), PluginRegistry()
+        load_plugins(first)
+        load_plugins(second)
+
+        assert _load_builtin_plugins() is _load_builtin_plugins()
+        # Each registry still gets its own plugin instances
+        assert {p.id for p in first} == {p.id for p in second}
+        assert first.get("old_kernels") is not second.get("old_kernels")
+
+    def test_populated_registry_skips_discovery(self):
+        registry = PluginRegistry()
+        registry.register(_load_builtin_plugins()[0]())
+        load_plugins(registry)
+        assert len(registry) == 1
+
+        fresh = PluginRegistry()
+        load_plugins(fresh)
+        load_plugins(registry, force=True)
+        assert len(registry) == len(fresh)
+
+    def test_forced_reload_does_not_warn(self, caplog):
+        registry = PluginRegistry()
+        load_plugins(registry)
+
+        with caplog.at_level(logging.WARNING):
+            load_plugins(registry, force=True)
+        assert not caplog.records
@@ -0,0 +1,26 @@
+"""Tests for shared utility functions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sweep.utils import common_parent
+
+
+class TestCommonParent:
+    def test_empty(self):
+        assert common_parent([]) == Path("/")
+
+    def test_single_path(self):
+        assert common_parent([Path("/home/alice/x")]) == Path("/home/alice")
+
+    def test_nested_paths(self):
+        paths = [Path("/var/cache/a/1"), Path("/var/cache/a/b/2"), Path("/var/cache/c/3")]
+        assert common_parent(paths) == Path("/var/cache")
+
+    def test_sibling_prefix_is_not_a_parent(self):
+        paths = [Path("/home/al/x"), Path("/home/alice/x")]
+        assert common_parent(paths) == Path("/home")
+
+    def test_no_shared_directory(self):
+        assert common_parent([Path("/usr/a"), Path("/var/b")]) == Path("/")